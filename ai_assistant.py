@@ -15,45 +15,243 @@ Date: April 2025
 
 import json
 import os
+import re
 import sys
 import argparse
-from typing import Dict, List, Any, Optional
-import ipaddress
-from subnet_calculator import SubnetCalculator  # Import from existing module
+import asyncio
+import hashlib
+import math
+import signal
+import sqlite3
+import string
+import time
+from array import array
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from functools import cached_property, lru_cache
+from operator import mul
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union
 
-# Import OpenAI library with version flexibility
+# The OpenAI library is imported on first use; its clients are only named here for annotations
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+
+# Use orjson for the JSON hot paths when available, falling back to the standard library
 try:
-    # Try new OpenAI package structure first
-    from openai import OpenAI
-    OPENAI_INSTALLED = True
+    import orjson
+    json_loads = orjson.loads
 except ImportError:
+    json_loads = json.loads
+
+# Model and output token limit per kind of request. Short factual answers use a
+# smaller, faster model; long plans and step-by-step solutions use a larger one.
+# Quiz requests are batched, so their limit covers QUIZ_BATCH_SIZE questions.
+MODEL_CONFIG: Dict[str, Tuple[str, int]] = {
+    "explain": ("gpt-4o-mini", 400),
+    "quiz": ("gpt-4o-mini", 1500),
+    "plan": ("gpt-4o", 900),
+    "solve": ("gpt-4o", 900),
+    "troubleshoot": ("gpt-4o", 800),
+}
+
+# Settings shared by all requests
+SYSTEM_PROMPT = "You are an expert networking assistant specializing in IP addressing, subnetting, and network design. Provide technically accurate, clear, and educational responses."
+TEMPERATURE = 0.1  # Low temperature for more deterministic, factual responses
+
+# On-disk cache of AI responses and how long entries stay valid (30 days). It lives
+# next to this module so the CLI and the Streamlit app share it wherever they are started.
+RESPONSE_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".subnet_ai_cache.sqlite3")
+RESPONSE_CACHE_TTL = 30 * 86400
+
+# Embedding model and default cosine similarity used by the semantic cache
+EMBEDDING_MODEL = "text-embedding-3-small"
+SIMILARITY_THRESHOLD = 0.93
+
+# Most semantic cache entries kept per kind of request; the oldest are evicted first
+SEMANTIC_CACHE_MAX_ENTRIES = 500
+
+# Addresses, CIDRs and plain numbers in a query. Similar wording with different
+# numbers ("50 hosts" vs "500 hosts") needs a different answer, so semantic
+# cache hits require the same numbers in the same order.
+_QUERY_NUMBER_PATTERN = re.compile(r'\d+(?:\.\d+){3}(?:/\d+)?|\d+')
+
+# Prefix of the text returned when an API request fails
+ERROR_PREFIX = "Error getting AI response: "
+
+# Number of quiz questions requested per API call when refilling the pool
+QUIZ_BATCH_SIZE = 5
+
+# Refill the pool in the background once it holds fewer questions than this
+QUIZ_REFILL_THRESHOLD = 2
+
+# Maximum number of concurrent requests issued by the async helpers
+MAX_CONCURRENT_REQUESTS = 48
+
+# HTTP connection pool shared by requests from one client, and the number of
+# retries (with the library's exponential backoff) on rate limits and transient errors
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_TIMEOUT = 30.0
+MAX_RETRIES = 3
+
+# Structured output schema for quiz batches, so responses always parse
+QUIZ_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "quiz_questions",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "question": {"type": "string"},
+                            "answer": {"type": "string"},
+                            "explanation": {"type": "string"}
+                        },
+                        "required": ["question", "answer", "explanation"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["items"],
+            "additionalProperties": False
+        }
+    }
+}
+
+# Prompt templates, split around the user's text so building a prompt is a plain concatenation
+_EXPLAIN_PROMPT = (
+    '''Explain the networking concept of "''',
+    '''" related to IP subnetting. 
+        Provide a clear, concise explanation that would help a networking student understand the concept.
+        Include practical examples if relevant.'''
+)
+
+_PLAN_PROMPT = (
+    """As a network planning assistant, create a detailed IP addressing and subnetting plan based on these requirements:
+
+        """,
+    """
+        
+        Provide:
+        1. IP address range selection with justification
+        2. Subnet breakdown with sizes, masks, and usable ranges
+        3. Network diagram description
+        4. VLSM implementation if needed
+        5. Any special considerations for routing or security
+        
+        Be specific with actual IP addresses and subnet masks."""
+)
+
+_SOLVE_PROMPT = (
+    """Analyze this IP subnetting problem and provide a detailed, step-by-step solution:
+
+        """,
+    """
+        
+        Show all work including:
+        1. Initial analysis of the problem
+        2. Required calculations with formulas
+        3. Working through each step with clear explanations
+        4. Final solution with verification"""
+)
+
+_TROUBLESHOOT_PROMPT = (
+    """As a network troubleshooting assistant, analyze this subnet-related issue and provide detailed troubleshooting steps:
+
+        """,
+    """
+        
+        Include:
+        1. Potential causes of the issue
+        2. Step-by-step troubleshooting procedure
+        3. Commands to use for diagnosis (with syntax)
+        4. Potential solutions for each likely cause
+        5. Best practices to prevent this issue in the future"""
+)
+
+_QUIZ_PROMPT = string.Template("""Generate $n different $difficulty difficulty IP subnetting practice questions. 
+        Each question should test understanding of subnet calculations, CIDR notation, or IP address allocation.
+        
+        Return ONLY a JSON object with an "items" array of exactly $n objects in this exact format:
+        {
+            "items": [
+                {
+                    "question": "The question text",
+                    "answer": "The correct answer",
+                    "explanation": "Detailed explanation of how to solve the problem"
+                }
+            ]
+        }""")
+
+def _create_http_client(client_class: type) -> Any:
+    """
+    Create a pooled HTTP client for the OpenAI clients.
+    
+    HTTP/2 lets concurrent requests share one connection; it needs the
+    optional h2 package, so plain HTTP/1.1 keep-alive is used without it.
+    
+    Args:
+        client_class: httpx.Client or httpx.AsyncClient
+        
+    Returns:
+        An instance of client_class
+    """
+    import httpx
+    limits = httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS,
+                          max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS)
     try:
-        # Try legacy OpenAI package
-        import openai
-        OPENAI_INSTALLED = True
-        # Create compatibility wrapper
-        class OpenAI:
-            def __init__(self):
-                self.api_key = None
-                # Map new API structure to old
-                self.chat = type('ChatObject', (), {'completions': openai})()
+        return client_class(http2=True, limits=limits, timeout=HTTP_TIMEOUT)
     except ImportError:
-        print("OpenAI library not found. Installing...")
-        import subprocess
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "openai"])
-        # Try the import again after installation
-        try:
-            from openai import OpenAI
-            OPENAI_INSTALLED = True
-        except ImportError:
-            import openai
-            OPENAI_INSTALLED = True
-            # Create compatibility wrapper for older versions
-            class OpenAI:
-                def __init__(self):
-                    self.api_key = None
-                    # Map new API structure to old
-                    self.chat = type('ChatObject', (), {'completions': openai})()
+        return client_class(limits=limits, timeout=HTTP_TIMEOUT)
+
+
+@lru_cache(maxsize=1)
+def _shared_http_client() -> Any:
+    """
+    Get the process-wide HTTP client used by every synchronous OpenAI client.
+    
+    Sharing it means all SubnetAI instances, such as one per Streamlit session,
+    reuse the same pool of open connections instead of each doing its own TLS handshakes.
+    
+    Returns:
+        A shared httpx.Client
+    """
+    import httpx
+    return _create_http_client(httpx.Client)
+
+
+@lru_cache(maxsize=None)
+def load_config(config_path: str = "config.json") -> Dict[str, str]:
+    """
+    Load the API key, preferring the OPENAI_API_KEY environment variable over the config file.
+    
+    The result is cached, so the file is read at most once per path.
+    
+    Args:
+        config_path: Path to configuration file, used when the environment variable is unset
+        
+    Returns:
+        Dictionary containing configuration
+        
+    Raises:
+        FileNotFoundError: If the environment variable is unset and the config file doesn't exist
+    """
+    api_key = os.environ.get("OPENAI_API_KEY")
+    if api_key:
+        return {"openai_api_key": api_key}
+    
+    if not os.path.exists(config_path):
+        raise FileNotFoundError(f"Configuration file not found: {config_path} (or set OPENAI_API_KEY)")
+        
+    with open(config_path, 'rb') as f:
+        return json_loads(f.read())
+
 
 class SubnetAI:
     """
@@ -61,176 +259,281 @@ class SubnetAI:
     assistance for network planning and subnet explanations.
     """
     
-    def __init__(self, config_path: str = "config.json") -> None:
+    def __init__(self, config_path: str = "config.json", cache_path: str = RESPONSE_CACHE_PATH,
+                 similarity_threshold: float = SIMILARITY_THRESHOLD) -> None:
         """
-        Initialize the SubnetAI with the OpenAI API key from a config file.
+        Initialize the SubnetAI with the OpenAI API key from the environment or a config file.
         
         Args:
             config_path: Path to configuration file with API key
+            cache_path: Path to the SQLite file used to cache responses
+            similarity_threshold: Minimum cosine similarity for a semantic cache hit
+        """
+        self.cache_path = cache_path
+        self.similarity_threshold = similarity_threshold
+        self.config = load_config(config_path)
+        self._init_cache()
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        # Pre-generated quiz questions, keyed by difficulty; per instance since they depend on its model and key
+        self._quiz_pool: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._quiz_refills: Dict[str, Future] = {}
+    
+    def close(self) -> None:
+        """
+        Stop the background worker threads, discarding any queued prefetches.
         """
-        self.config = self._load_config(config_path)
-        self.client = self._initialize_openai()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    @cached_property
+    def client(self) -> "OpenAI":
+        """OpenAI client, created on first use so startup doesn't pay for importing the library."""
+        return self._initialize_openai()
         
-    def _load_config(self, config_path: str) -> Dict[str, str]:
+    def _initialize_openai(self) -> "OpenAI":
         """
-        Load API key from config file.
+        Initialize the OpenAI client with the API key.
         
-        Args:
-            config_path: Path to configuration file
-            
         Returns:
-            Dictionary containing configuration
+            OpenAI client
             
         Raises:
-            FileNotFoundError: If config file doesn't exist
+            ImportError: If the OpenAI library is not installed
         """
-        if not os.path.exists(config_path):
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        api_key = self.config.get("openai_api_key")
+        if not api_key:
+            raise ValueError("OpenAI API key not found in OPENAI_API_KEY or the configuration file")
+        
+        # Import OpenAI library with version flexibility
+        try:
+            # Try new OpenAI package structure first
+            from openai import OpenAI
+        except ImportError:
+            try:
+                # Try legacy OpenAI package
+                import openai
+            except ImportError:
+                raise ImportError("OpenAI library not found. Install it with: pip install openai")
             
-        with open(config_path, 'r') as f:
-            return json.load(f)
+            # Create compatibility wrapper
+            class OpenAI:
+                def __init__(self):
+                    self.api_key = None
+                    # Map new API structure to old
+                    self.chat = type('ChatObject', (), {'completions': openai})()
+            
+            client = OpenAI()
+            client.api_key = api_key
+            return client
+        
+        return OpenAI(api_key=api_key, max_retries=MAX_RETRIES, http_client=_shared_http_client())
     
-    def _initialize_openai(self) -> OpenAI:
+    def _initialize_async_openai(self) -> Optional["AsyncOpenAI"]:
         """
-        Initialize the OpenAI client with the API key.
+        Initialize a new asynchronous OpenAI client with the API key.
+        
+        Its connections are tied to the event loop that opens them, so each
+        client must be used and closed within a single asyncio.run call.
         
         Returns:
-            OpenAI client
+            AsyncOpenAI client, or None if the installed library doesn't provide one
         """
-        api_key = self.config.get("openai_api_key")
-        if not api_key:
-            raise ValueError("OpenAI API key not found in configuration file")
-            
-        # Create client with just the API key to ensure compatibility with all versions
-        client = OpenAI()
-        client.api_key = api_key
-        return client
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:
+            # The async client is only available in the new package structure
+            return None
+        
+        # Async connections are tied to the event loop that opened them, so they aren't shared
+        # between instances or event loops
+        import httpx
+        return AsyncOpenAI(api_key=self.config.get("openai_api_key"), max_retries=MAX_RETRIES,
+                           http_client=_create_http_client(httpx.AsyncClient))
     
-    def explain_subnetting_concept(self, concept: str) -> str:
+    def explain_subnetting_concept(self, concept: str, stream: bool = False) -> Union[str, Iterator[str]]:
         """
         Provide an explanation of a subnetting concept using AI.
         
         Args:
             concept: The subnetting concept to explain
+            stream: Return an iterator of text chunks as they arrive
             
         Returns:
             An explanation of the concept
         """
-        prompt = f"""Explain the networking concept of "{concept}" related to IP subnetting. 
-        Provide a clear, concise explanation that would help a networking student understand the concept.
-        Include practical examples if relevant."""
+        prompt = self._explain_prompt(concept)
+        return self._stream_ai_response(prompt, "explain") if stream else self._get_ai_response(prompt, "explain")
+    
+    @staticmethod
+    def _explain_prompt(concept: str) -> str:
+        """
+        Build the prompt used to explain a subnetting concept.
+        
+        Args:
+            concept: The subnetting concept to explain
+            
+        Returns:
+            The prompt text
+        """
+        return _EXPLAIN_PROMPT[0] + concept + _EXPLAIN_PROMPT[1]
+    
+    async def batch_explain(self, concepts: List[str]) -> List[str]:
+        """
+        Explain several subnetting concepts concurrently.
+        
+        Args:
+            concepts: The subnetting concepts to explain
+            
+        Returns:
+            Explanations in the same order as the concepts
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        aclient = self._initialize_async_openai()
+        
+        async def explain(concept: str) -> str:
+            async with semaphore:
+                return await self._get_ai_response_async(self._explain_prompt(concept), aclient, "explain")
+        
+        if aclient is None:
+            return await asyncio.gather(*[explain(concept) for concept in concepts])
         
-        return self._get_ai_response(prompt)
+        # Close the client, and its pooled connections, before this call's event loop ends
+        async with aclient:
+            return await asyncio.gather(*[explain(concept) for concept in concepts])
     
-    def plan_network(self, requirements: str) -> str:
+    def plan_network(self, requirements: str, stream: bool = False) -> Union[str, Iterator[str]]:
         """
         Generate a network plan based on requirements.
         
         Args:
             requirements: Description of network requirements
+            stream: Return an iterator of text chunks as they arrive
             
         Returns:
             A network plan including recommended subnets and IP addressing
         """
-        prompt = f"""As a network planning assistant, create a detailed IP addressing and subnetting plan based on these requirements:
-
-        {requirements}
-        
-        Provide:
-        1. IP address range selection with justification
-        2. Subnet breakdown with sizes, masks, and usable ranges
-        3. Network diagram description
-        4. VLSM implementation if needed
-        5. Any special considerations for routing or security
+        prompt = _PLAN_PROMPT[0] + requirements + _PLAN_PROMPT[1]
         
-        Be specific with actual IP addresses and subnet masks."""
-        
-        return self._get_ai_response(prompt)
+        return self._get_semantic_response("plan", requirements, prompt, stream)
     
-    def analyze_subnet_problem(self, problem: str) -> str:
+    def analyze_subnet_problem(self, problem: str, stream: bool = False) -> Union[str, Iterator[str]]:
         """
         Analyze a subnetting problem and provide steps to solve it.
         
         Args:
             problem: Description of the subnetting problem
+            stream: Return an iterator of text chunks as they arrive
             
         Returns:
             Step-by-step solution to the problem
         """
-        prompt = f"""Analyze this IP subnetting problem and provide a detailed, step-by-step solution:
-
-        {problem}
+        prompt = _SOLVE_PROMPT[0] + problem + _SOLVE_PROMPT[1]
         
-        Show all work including:
-        1. Initial analysis of the problem
-        2. Required calculations with formulas
-        3. Working through each step with clear explanations
-        4. Final solution with verification"""
-        
-        return self._get_ai_response(prompt)
+        return self._stream_ai_response(prompt, "solve") if stream else self._get_ai_response(prompt, "solve")
     
-    def get_quiz_question(self, difficulty: str = "medium") -> Dict[str, Any]:
+    def get_quiz_question(self, difficulty: str = "medium", prefetch: bool = False) -> Dict[str, Any]:
         """
-        Generate a subnetting quiz question for practice.
+        Get a subnetting quiz question for practice.
+        
+        Questions are served from a per-difficulty pool. With prefetch, the pool
+        is refilled with a batch of QUIZ_BATCH_SIZE questions from a single API
+        call; otherwise only the one question needed is requested.
         
         Args:
             difficulty: Difficulty level ("easy", "medium", "hard")
+            prefetch: Fetch questions in batches and refill the pool in the background
+                      once it runs low, so the next question is ready while the user
+                      works on this one. Only worth it when more questions will be asked.
             
         Returns:
             Dictionary containing question, answer, and explanation
         """
-        prompt = f"""Generate a {difficulty} difficulty IP subnetting practice question. 
-        The question should test understanding of subnet calculations, CIDR notation, or IP address allocation.
+        pool = self._quiz_pool[difficulty]
+        if not pool:
+            # Wait for a background refill already in flight before starting another
+            pending = self._quiz_refills.pop(difficulty, None)
+            if pending is not None:
+                pending.result()
+            if not pool:
+                pool.extend(self.get_quiz_questions(difficulty, QUIZ_BATCH_SIZE if prefetch else 1))
+        question = pool.popleft()
         
-        Return in this exact JSON format:
-        {{
-            "question": "The question text",
-            "answer": "The correct answer",
-            "explanation": "Detailed explanation of how to solve the problem"
-        }}"""
+        if prefetch:
+            self.prefetch_quiz_questions(difficulty)
+        return question
+    
+    def prefetch_quiz_questions(self, difficulty: str = "medium") -> None:
+        """
+        Refill the quiz pool in a background thread if it is running low.
+        
+        Args:
+            difficulty: Difficulty level ("easy", "medium", "hard")
+        """
+        pool = self._quiz_pool[difficulty]
+        if len(pool) >= QUIZ_REFILL_THRESHOLD:
+            return
         
-        response = self._get_ai_response(prompt)
+        pending = self._quiz_refills.get(difficulty)
+        if pending is not None and not pending.done():
+            return
         
+        self._quiz_refills[difficulty] = self._executor.submit(
+            lambda: pool.extend(self.get_quiz_questions(difficulty, QUIZ_BATCH_SIZE)))
+    
+    def get_quiz_questions(self, difficulty: str = "medium", n: int = 1) -> List[Dict[str, Any]]:
+        """
+        Generate several subnetting quiz questions with a single API call.
+        
+        Args:
+            difficulty: Difficulty level ("easy", "medium", "hard")
+            n: Number of questions to generate
+            
+        Returns:
+            List of dictionaries containing question, answer, and explanation
+            
+        Raises:
+            RuntimeError: If the API request fails, is truncated or returns no questions
+        """
+        prompt = _QUIZ_PROMPT.substitute(n=n, difficulty=difficulty)
+        
+        # Quiz questions are never cached so each batch is fresh
+        response = self._get_ai_response(prompt, "quiz", response_format=QUIZ_RESPONSE_FORMAT, use_cache=False)
+        if response.startswith(ERROR_PREFIX):
+            raise RuntimeError(response)
+        
+        # The response format guarantees the quiz schema's shape, but not that any items were produced
         try:
-            # Parse the response as JSON
-            return json.loads(response)
-        except json.JSONDecodeError:
-            # If not valid JSON, return as text
-            return {
-                "question": "Generated question might not be in correct format",
-                "answer": "See explanation",
-                "explanation": response
-            }
-    
-    def troubleshoot_subnet_issue(self, issue_description: str) -> str:
+            items = json_loads(response)["items"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise RuntimeError(f"Invalid quiz response: {e}")
+        if not isinstance(items, list) or not items:
+            raise RuntimeError("The quiz response contained no questions")
+        return items
+    
+    def troubleshoot_subnet_issue(self, issue_description: str, stream: bool = False) -> Union[str, Iterator[str]]:
         """
         Provide troubleshooting guidance for subnet-related issues.
         
         Args:
             issue_description: Description of the networking issue
+            stream: Return an iterator of text chunks as they arrive
             
         Returns:
             Troubleshooting steps and potential solutions
         """
-        prompt = f"""As a network troubleshooting assistant, analyze this subnet-related issue and provide detailed troubleshooting steps:
-
-        {issue_description}
+        prompt = _TROUBLESHOOT_PROMPT[0] + issue_description + _TROUBLESHOOT_PROMPT[1]
         
-        Include:
-        1. Potential causes of the issue
-        2. Step-by-step troubleshooting procedure
-        3. Commands to use for diagnosis (with syntax)
-        4. Potential solutions for each likely cause
-        5. Best practices to prevent this issue in the future"""
-        
-        return self._get_ai_response(prompt)
+        return self._get_semantic_response("troubleshoot", issue_description, prompt, stream)
     
-    def _get_ai_response(self, prompt: str) -> str:
+    def _get_ai_response(self, prompt: str, kind: str = "plan", response_format: Optional[Dict[str, Any]] = None,
+                         use_cache: bool = True) -> str:
         """
-        Get a response from the OpenAI API.
+        Get a response from the OpenAI API, using the on-disk cache when possible.
         
         Args:
             prompt: The prompt to send to the API
+            kind: Kind of request, selects the model and token limit from MODEL_CONFIG
+            response_format: Optional response format, e.g. a JSON schema the output must match
+            use_cache: Look up and store the response in the response cache
             
         Returns:
             The API response
@@ -238,48 +541,397 @@ class SubnetAI:
         Raises:
             Exception: If there's an error with the API request
         """
+        model, max_tokens = MODEL_CONFIG[kind]
+        key = self._cache_key(prompt, model)
+        if use_cache:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+        
         try:
-            # Use a more widely available model
-            model = "gpt-3.5-turbo"
-            
             # Handle different API versions
             try:
                 # Try new API format first
+                extra_args = {"response_format": response_format} if response_format else {}
                 response = self.client.chat.completions.create(
                     model=model,
                     messages=[
-                        {"role": "system", "content": "You are an expert networking assistant specializing in IP addressing, subnetting, and network design. Provide technically accurate, clear, and educational responses."},
+                        {"role": "system", "content": SYSTEM_PROMPT},
                         {"role": "user", "content": prompt}
                     ],
-                    temperature=0.1,  # Low temperature for more deterministic, factual responses
-                    max_tokens=1000
+                    temperature=TEMPERATURE,
+                    max_tokens=max_tokens,
+                    **extra_args
                 )
-                return response.choices[0].message.content.strip()
+                choice = response.choices[0]
+                if response_format and choice.finish_reason == "length":
+                    # Structured output cut off at max_tokens can't be parsed
+                    return f"{ERROR_PREFIX}response was truncated at {max_tokens} tokens"
+                text = choice.message.content.strip()
             except AttributeError:
                 # Fall back to older API format
                 response = self.client.completions.create(
                     model=model,
-                    prompt=f"You are an expert networking assistant specializing in IP addressing, subnetting, and network design.\n\nUser: {prompt}\n\nAssistant:",
-                    temperature=0.1,
-                    max_tokens=1000
+                    prompt=f"{SYSTEM_PROMPT}\n\nUser: {prompt}\n\nAssistant:",
+                    temperature=TEMPERATURE,
+                    max_tokens=max_tokens
                 )
-                return response.choices[0].text.strip()
+                text = response.choices[0].text.strip()
+            
+        except Exception as e:
+            return f"{ERROR_PREFIX}{str(e)}"
+        
+        if use_cache:
+            self._cache_set(key, text)
+        return text
+    
+    def _stream_ai_response(self, prompt: str, kind: str = "plan",
+                            on_complete: Optional[Callable[[str], None]] = None) -> Iterator[str]:
+        """
+        Stream a response from the OpenAI API chunk by chunk.
+        
+        The complete text is stored in the response cache once the stream finishes.
+        
+        Args:
+            prompt: The prompt to send to the API
+            kind: Kind of request, selects the model and token limit from MODEL_CONFIG
+            on_complete: Optional callback receiving the complete response text
             
+        Yields:
+            Chunks of the response text
+        """
+        model, max_tokens = MODEL_CONFIG[kind]
+        key = self._cache_key(prompt, model)
+        cached = self._cache_get(key)
+        if cached is not None:
+            yield cached
+            return
+        
+        try:
+            response = self.client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=TEMPERATURE,
+                max_tokens=max_tokens,
+                stream=True
+            )
+        except AttributeError:
+            # Older API versions don't support streaming chat completions
+            text = self._get_ai_response(prompt, kind)
+            if on_complete:
+                on_complete(text)
+            yield text
+            return
+        except Exception as e:
+            yield f"{ERROR_PREFIX}{str(e)}"
+            return
+        
+        chunks = []
+        try:
+            for chunk in response:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content or ""
+                chunks.append(content)
+                yield content
         except Exception as e:
-            return f"Error getting AI response: {str(e)}"
+            yield f"\n{ERROR_PREFIX}{str(e)}"
+            return
+        
+        text = "".join(chunks).strip()
+        self._cache_set(key, text)
+        if on_complete:
+            on_complete(text)
+    
+    async def _get_ai_response_async(self, prompt: str, aclient: Optional["AsyncOpenAI"], kind: str = "plan") -> str:
+        """
+        Get a response from the OpenAI API without blocking the event loop.
+        
+        Args:
+            prompt: The prompt to send to the API
+            aclient: Asynchronous client opened on the running event loop, or None
+                     to run the blocking client in a worker thread
+            kind: Kind of request, selects the model and token limit from MODEL_CONFIG
+            
+        Returns:
+            The API response
+        """
+        model, max_tokens = MODEL_CONFIG[kind]
+        key = self._cache_key(prompt, model)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            if aclient is None:
+                # Legacy library: run the blocking call in a worker thread
+                return await asyncio.to_thread(self._get_ai_response, prompt, kind)
+            
+            response = await aclient.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=TEMPERATURE,
+                max_tokens=max_tokens
+            )
+            text = response.choices[0].message.content.strip()
+        except Exception as e:
+            return f"{ERROR_PREFIX}{str(e)}"
+        
+        self._cache_set(key, text)
+        return text
+    
+    def _get_semantic_response(self, kind: str, query: str, prompt: str,
+                               stream: bool = False) -> Union[str, Iterator[str]]:
+        """
+        Get a response, reusing the answer to a previous query with a similar meaning.
+        
+        The exact-match response cache is checked first. Free-form requests such as
+        "4 subnets for 50 hosts each" and "plan 4 subnets, 50 hosts per subnet" miss
+        it, so their embeddings are then compared against earlier queries of the
+        same kind that mention the same numbers and CIDRs.
+        
+        Args:
+            kind: Query category, only queries of the same kind are compared; also
+                  selects the model from MODEL_CONFIG
+            query: The user's free-form text
+            prompt: The full prompt to send to the API on a cache miss
+            stream: Return an iterator of text chunks as they arrive
+            
+        Returns:
+            The API response
+        """
+        # An exact repeat is answered without the embeddings round trip
+        cached = self._cache_get(self._cache_key(prompt, MODEL_CONFIG[kind][0]))
+        if cached is not None:
+            return iter([cached]) if stream else cached
+        
+        numbers = " ".join(_QUERY_NUMBER_PATTERN.findall(query))
+        embedding = self._embed(query)
+        if embedding is not None:
+            cached = self._semantic_cache_get(kind, numbers, embedding)
+            if cached is not None:
+                return iter([cached]) if stream else cached
+        
+        def remember(response: str) -> None:
+            if embedding is not None and not response.startswith(ERROR_PREFIX):
+                self._semantic_cache_set(kind, numbers, embedding, response)
+        
+        if stream:
+            return self._stream_ai_response(prompt, kind, on_complete=remember)
+        
+        response = self._get_ai_response(prompt, kind)
+        remember(response)
+        return response
+    
+    def _embed(self, text: str) -> Optional[List[float]]:
+        """
+        Compute a unit-length embedding for a piece of text.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            The normalized embedding, or None if embeddings are unavailable
+        """
+        try:
+            response = self.client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+            embedding = response.data[0].embedding
+        except Exception:
+            return None
+        
+        norm = math.sqrt(sum(x * x for x in embedding))
+        return [x / norm for x in embedding] if norm else None
+    
+    def _semantic_cache_get(self, kind: str, numbers: str, embedding: List[float]) -> Optional[str]:
+        """
+        Find the cached response whose query is most similar to an embedding.
+        
+        Args:
+            kind: Query category
+            numbers: The numbers and CIDRs in the new query; only queries with the same ones are compared
+            embedding: Normalized embedding of the new query
+            
+        Returns:
+            The best cached response if its similarity reaches the threshold, otherwise None
+        """
+        try:
+            with self._connect_cache() as conn:
+                rows = conn.execute("SELECT embedding, response FROM semantic_cache "
+                                    "WHERE kind = ? AND numbers = ? AND expires > ?",
+                                    (kind, numbers, time.time())).fetchall()
+        except sqlite3.Error:
+            return None
+        
+        best_response, best_similarity = None, self.similarity_threshold
+        stored_embedding = array('f')
+        for stored, response in rows:
+            del stored_embedding[:]
+            stored_embedding.frombytes(stored)
+            # Embeddings are stored normalized, so the dot product is the cosine similarity
+            similarity = sum(map(mul, embedding, stored_embedding))
+            if similarity >= best_similarity:
+                best_response, best_similarity = response, similarity
+        return best_response
+    
+    def _semantic_cache_set(self, kind: str, numbers: str, embedding: List[float], response: str) -> None:
+        """
+        Store a response in the semantic cache, dropping expired entries and
+        the oldest ones beyond SEMANTIC_CACHE_MAX_ENTRIES for the kind.
+        
+        Args:
+            kind: Query category
+            numbers: The numbers and CIDRs in the query
+            embedding: Normalized embedding of the query
+            response: The response text to store
+        """
+        try:
+            now = time.time()
+            with self._connect_cache() as conn, conn:
+                conn.execute("DELETE FROM semantic_cache WHERE expires <= ?", (now,))
+                conn.execute("INSERT INTO semantic_cache VALUES (?, ?, ?, ?, ?)",
+                             (kind, numbers, array('f', embedding).tobytes(), response, now + RESPONSE_CACHE_TTL))
+                conn.execute("DELETE FROM semantic_cache WHERE kind = ? AND rowid NOT IN "
+                             "(SELECT rowid FROM semantic_cache WHERE kind = ? ORDER BY expires DESC LIMIT ?)",
+                             (kind, kind, SEMANTIC_CACHE_MAX_ENTRIES))
+        except sqlite3.Error:
+            pass
+    
+    def _connect_cache(self) -> "closing[sqlite3.Connection]":
+        """
+        Open the response cache database.
+        
+        Connections are short-lived and closed on exit, so an instance can be
+        used from several threads, such as Streamlit's script runners.
+        
+        Returns:
+            A context manager yielding the connection and closing it afterwards
+        """
+        return closing(sqlite3.connect(self.cache_path))
+    
+    def _init_cache(self) -> None:
+        """
+        Create the response and semantic cache tables once, when the instance is created.
+        """
+        try:
+            with self._connect_cache() as conn, conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT, expires REAL)")
+                conn.execute("CREATE TABLE IF NOT EXISTS semantic_cache "
+                             "(kind TEXT, numbers TEXT, embedding BLOB, response TEXT, expires REAL)")
+                conn.execute("CREATE INDEX IF NOT EXISTS semantic_cache_lookup ON semantic_cache (kind, numbers, expires)")
+        except sqlite3.Error:
+            # The cache is an optimization only; lookups and stores fail quietly without it
+            pass
+    
+    @staticmethod
+    def _cache_key(prompt: str, model: str) -> str:
+        """
+        Build the response cache key for a prompt.
+        
+        Args:
+            prompt: The prompt sent to the API
+            model: The model answering the prompt
+            
+        Returns:
+            Hex digest identifying the model, system prompt, prompt and temperature
+        """
+        return hashlib.sha256(f"{model}|{SYSTEM_PROMPT}|{prompt}|{TEMPERATURE}".encode()).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key from _cache_key
+            
+        Returns:
+            The cached response, or None if missing, expired or the cache is unavailable
+        """
+        try:
+            with self._connect_cache() as conn:
+                row = conn.execute("SELECT response FROM responses WHERE key = ? AND expires > ?",
+                                   (key, time.time())).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+    
+    def _cache_set(self, key: str, response: str) -> None:
+        """
+        Store a response in the cache.
+        
+        Args:
+            key: Cache key from _cache_key
+            response: The response text to store
+        """
+        try:
+            with self._connect_cache() as conn, conn:
+                conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                             (key, response, time.time() + RESPONSE_CACHE_TTL))
+        except sqlite3.Error:
+            # The cache is an optimization only; never fail a request because of it
+            pass
 
 
-def display_explanation(explanation: str) -> None:
+def _terminal_width() -> int:
+    """
+    Get the width used for separators, capped at 100 columns.
+    
+    Returns:
+        The separator width
+    """
+    try:
+        return min(100, os.get_terminal_size().columns)
+    except OSError:
+        # Not attached to a terminal
+        return 100
+
+
+# Separator line, recomputed only when the terminal is resized
+_SEPARATOR = "=" * _terminal_width()
+
+
+def _on_resize(signum: int, frame: Any) -> None:
+    """
+    Recompute the separator line after a terminal resize.
+    """
+    global _SEPARATOR
+    _SEPARATOR = "=" * _terminal_width()
+
+
+def _install_resize_handler() -> None:
+    """
+    Track terminal resizes while the command-line interface runs.
+    
+    Only called from main, so importing the module never replaces a host
+    process's own SIGWINCH handler.
+    """
+    try:
+        signal.signal(signal.SIGWINCH, _on_resize)
+    except (AttributeError, ValueError):
+        # SIGWINCH is unavailable on Windows, and handlers can only be set from the main thread
+        pass
+
+
+def display_explanation(explanation: Union[str, Iterator[str]]) -> None:
     """
     Display an explanation with nice formatting.
     
     Args:
-        explanation: Text to display
+        explanation: Text to display, or an iterator of text chunks printed as they arrive
     """
-    width = min(100, os.get_terminal_size().columns)
-    print("\n" + "=" * width)
-    print(explanation)
-    print("=" * width + "\n")
+    if isinstance(explanation, str):
+        print(f"\n{_SEPARATOR}\n{explanation}\n{_SEPARATOR}\n")
+        return
+    
+    print(f"\n{_SEPARATOR}")
+    for chunk in explanation:
+        print(chunk, end="", flush=True)
+    print(f"\n{_SEPARATOR}\n")
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -323,6 +975,99 @@ def parse_arguments() -> argparse.Namespace:
     return parser.parse_args()
 
 
+_MENU = """Available operations:
+1. Explain a subnetting concept
+2. Plan a network
+3. Get help with a subnetting problem
+4. Generate a practice quiz question
+5. Troubleshoot a networking issue
+6. Exit"""
+
+_DIFFICULTIES = {'1': 'easy', '2': 'medium', '3': 'hard'}
+
+
+def _do_explain(subnet_ai: SubnetAI) -> bool:
+    """Explain one or more comma-separated subnetting concepts."""
+    concept = input("Enter the subnetting concept(s) you want explained (comma-separated): ").strip()
+    concepts = [c.strip() for c in concept.split(',') if c.strip()]
+    if len(concepts) > 1:
+        for explanation in asyncio.run(subnet_ai.batch_explain(concepts)):
+            display_explanation(explanation)
+    else:
+        explanation = subnet_ai.explain_subnetting_concept(concept, stream=True)
+        display_explanation(explanation)
+    return True
+
+
+def _do_plan(subnet_ai: SubnetAI) -> bool:
+    """Plan a network from a description of the requirements."""
+    requirements = input("Describe your network requirements: ").strip()
+    plan = subnet_ai.plan_network(requirements, stream=True)
+    display_explanation(plan)
+    return True
+
+
+def _do_solve(subnet_ai: SubnetAI) -> bool:
+    """Walk through the solution of a subnetting problem."""
+    problem = input("Describe the subnetting problem you need help with: ").strip()
+    solution = subnet_ai.analyze_subnet_problem(problem, stream=True)
+    display_explanation(solution)
+    return True
+
+
+def _do_quiz(subnet_ai: SubnetAI) -> bool:
+    """Ask a practice quiz question and reveal the answer on request."""
+    diff_choice = input("Select difficulty (1=Easy, 2=Medium, 3=Hard): ").strip()
+    difficulty = _DIFFICULTIES.get(diff_choice, 'medium')
+    
+    try:
+        quiz = subnet_ai.get_quiz_question(difficulty, prefetch=True)
+    except (RuntimeError, ValueError) as e:
+        print(f"Error: {e}")
+        return True
+    
+    print("\n" + "=" * 80)
+    print("QUESTION:")
+    print(quiz["question"])
+    print("\n" + "-" * 40)
+    
+    # Prompt for answer attempt
+    input("Press Enter when you're ready to see the answer...")
+    
+    print("\nANSWER:")
+    print(quiz["answer"])
+    print("\nEXPLANATION:")
+    print(quiz["explanation"])
+    print("=" * 80 + "\n")
+    return True
+
+
+def _do_troubleshoot(subnet_ai: SubnetAI) -> bool:
+    """Give troubleshooting guidance for a networking issue."""
+    issue = input("Describe the networking issue you're experiencing: ").strip()
+    guidance = subnet_ai.troubleshoot_subnet_issue(issue, stream=True)
+    display_explanation(guidance)
+    return True
+
+
+def _do_exit(subnet_ai: SubnetAI) -> bool:
+    """Leave interactive mode."""
+    subnet_ai.close()
+    print("\nExiting AI Subnet Assistant. Goodbye!\n")
+    return False
+
+
+# Interactive menu handlers; each returns False to leave the menu loop
+_HANDLERS: Dict[str, Callable[[SubnetAI], bool]] = {
+    '1': _do_explain,
+    '2': _do_plan,
+    '3': _do_solve,
+    '4': _do_quiz,
+    '5': _do_troubleshoot,
+    '6': _do_exit,
+}
+
+
 def interactive_mode(subnet_ai: SubnetAI) -> None:
     """
     Run the AI assistant in interactive mode.
@@ -335,62 +1080,15 @@ def interactive_mode(subnet_ai: SubnetAI) -> None:
     print("=" * 50 + "\n")
     
     while True:
-        print("Available operations:")
-        print("1. Explain a subnetting concept")
-        print("2. Plan a network")
-        print("3. Get help with a subnetting problem")
-        print("4. Generate a practice quiz question")
-        print("5. Troubleshoot a networking issue")
-        print("6. Exit")
+        print(_MENU)
         
         choice = input("\nEnter your choice (1-6): ").strip()
         
-        if choice == '1':
-            concept = input("Enter the subnetting concept you want explained: ").strip()
-            explanation = subnet_ai.explain_subnetting_concept(concept)
-            display_explanation(explanation)
-            
-        elif choice == '2':
-            requirements = input("Describe your network requirements: ").strip()
-            plan = subnet_ai.plan_network(requirements)
-            display_explanation(plan)
-            
-        elif choice == '3':
-            problem = input("Describe the subnetting problem you need help with: ").strip()
-            solution = subnet_ai.analyze_subnet_problem(problem)
-            display_explanation(solution)
-            
-        elif choice == '4':
-            difficulties = {'1': 'easy', '2': 'medium', '3': 'hard'}
-            diff_choice = input("Select difficulty (1=Easy, 2=Medium, 3=Hard): ").strip()
-            difficulty = difficulties.get(diff_choice, 'medium')
-            
-            quiz = subnet_ai.get_quiz_question(difficulty)
-            print("\n" + "=" * 80)
-            print("QUESTION:")
-            print(quiz["question"])
-            print("\n" + "-" * 40)
-            
-            # Prompt for answer attempt
-            input("Press Enter when you're ready to see the answer...")
-            
-            print("\nANSWER:")
-            print(quiz["answer"])
-            print("\nEXPLANATION:")
-            print(quiz["explanation"])
-            print("=" * 80 + "\n")
-            
-        elif choice == '5':
-            issue = input("Describe the networking issue you're experiencing: ").strip()
-            guidance = subnet_ai.troubleshoot_subnet_issue(issue)
-            display_explanation(guidance)
-            
-        elif choice == '6':
-            print("\nExiting AI Subnet Assistant. Goodbye!\n")
-            break
-            
-        else:
+        handler = _HANDLERS.get(choice)
+        if handler is None:
             print("Invalid choice. Please enter a number between 1 and 6.")
+        elif not handler(subnet_ai):
+            break
         
         print()  # Extra line for readability
 
@@ -402,20 +1100,22 @@ def main() -> int:
     Returns:
         Exit code
     """
+    _install_resize_handler()
+    
     try:
         args = parse_arguments()
         subnet_ai = SubnetAI()
         
         if args.mode == 'explain':
-            explanation = subnet_ai.explain_subnetting_concept(args.concept)
+            explanation = subnet_ai.explain_subnetting_concept(args.concept, stream=True)
             display_explanation(explanation)
             
         elif args.mode == 'plan':
-            plan = subnet_ai.plan_network(args.requirements)
+            plan = subnet_ai.plan_network(args.requirements, stream=True)
             display_explanation(plan)
             
         elif args.mode == 'solve':
-            solution = subnet_ai.analyze_subnet_problem(args.problem)
+            solution = subnet_ai.analyze_subnet_problem(args.problem, stream=True)
             display_explanation(solution)
             
         elif args.mode == 'quiz':
@@ -433,7 +1133,7 @@ def main() -> int:
             print(quiz["explanation"])
             
         elif args.mode == 'troubleshoot':
-            guidance = subnet_ai.troubleshoot_subnet_issue(args.issue)
+            guidance = subnet_ai.troubleshoot_subnet_issue(args.issue, stream=True)
             display_explanation(guidance)
             
         elif args.mode == 'interactive' or args.mode is None:
@@ -1,12 +1,8 @@
 import streamlit as st
 import ipaddress
-from subnet_calculator import SubnetCalculator
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-import io
-from PIL import Image
-import pandas as pd
-import time
+import os
+import re
+from subnet_calculator import SubnetCalculator, _format_ip, popcount
 
 # Must be at the very top - first Streamlit command
 st.set_page_config(
@@ -15,99 +11,166 @@ st.set_page_config(
     layout="wide",
 )
 
+# Quick syntactic check for CIDR input, so malformed text is rejected without
+# going through ipaddress and its exception handling on every keystroke
+# Octets are limited to 0-255 and the prefix to 0-32, so anything that matches will parse
+_OCTET = r"(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)"
+CIDR_PATTERN = re.compile(rf"^{_OCTET}(?:\.{_OCTET}){{3}}/(?:3[0-2]|[12]?\d)$")
+CIDR_ERROR = "Please enter a valid IP address in CIDR notation (e.g., 192.168.1.0/24)"
+
+# Static page text, defined once rather than inline in the render path
+INTRO_HTML = """
+<div class="info-box">
+<h3>Network Planning Tool</h3>
+A tool for IP subnetting and network planning. Perfect for students, IT professionals, and network administrators.
+<br><br>
+<b>This tool helps you:</b>
+<ul>
+    <li>Calculate network information from an IP address</li>
+    <li>Divide networks into smaller subnets</li>
+    <li>Find the right subnet size for your needs</li>
+    <li>Visualize networks and understand binary representations</li>
+</ul>
+</div>
+"""
+
+BINARY_HELP_MD = """
+**Binary Representation Explained:**
+
+* **Green bits:** Network portion - fixed for all hosts in this network
+* **Yellow bits:** Host portion - can vary to create different host addresses
+
+The subnet mask determines how many bits are used for the network vs. host portions. 
+A longer prefix (higher CIDR number) means more bits are used for the network portion,
+resulting in more subnets but fewer hosts per subnet.
+"""
+
+HOST_RESULT_TEMPLATE = """<div class='result-box'>{details}
+<div class='section-header'>Example Implementation</div>
+If you're using private IP space, you could implement this as:
+<ul>
+    <li><b>Class C:</b> 192.168.1.0/{prefix}</li>
+    <li><b>Class B:</b> 172.16.0.0/{prefix}</li>
+    <li><b>Class A:</b> 10.0.0.0/{prefix}</li>
+</ul>
+</div>"""
+
+FOOTER_HTML = """
+<div style="margin-top: 30px; padding-top: 20px; border-top: 1px solid #eaeff5; text-align: center; color: #6c757d; font-size: 0.9rem;">
+IP Subnet Calculator - A helpful tool for network engineers and IT professionals
+</div>
+"""
+
+# Subnet tables longer than this are truncated for display
+MAX_TABLE_ROWS = 1000
+
+# Subnet diagrams with more boxes than this are drawn without per-subnet labels
+MAX_LABELED_SUBNETS = 32
+
+# Divisions into more subnets than this are drawn as a single summary box
+MAX_DRAWN_SUBNETS = 64
+
 # Helper functions for visualizations
-def create_subnet_visualization(network_str, subnets=None):
-    """Create a visual representation of a network and its subnets"""
+def _svg_label(x, y, first_line, second_line, font_size, font_weight="normal"):
+    """Two centered lines of SVG text"""
+    return (f'<text x="{x:.1f}" y="{y:.1f}" text-anchor="middle" font-size="{font_size}" '
+            f'font-weight="{font_weight}" fill="#333333">'
+            f'<tspan x="{x:.1f}" dy="-0.2em">{first_line}</tspan>'
+            f'<tspan x="{x:.1f}" dy="1.3em">{second_line}</tspan></text>')
+
+@st.cache_data(max_entries=128, ttl=3600, show_spinner=False)
+def create_subnet_visualization(network_str, subnets_key=(), subnet_count=0):
+    """Create an SVG diagram of a network and its subnets.
+    
+    subnets_key is a tuple of (network_address, num_hosts) pairs so the result can be cached.
+    When it is empty but subnet_count is set, only a summary of the division is drawn.
+    The diagram is plain markup, so the browser draws it and no image is encoded on the server.
+    Returns None for an invalid network; callers report it, since st elements
+    inside a cached function are replayed on every cache hit.
+    """
     try:
         # Parse the network
         network = ipaddress.IPv4Network(network_str)
-        
-        # Create figure and axis
-        fig, ax = plt.subplots(figsize=(10, 4))
-        fig.patch.set_facecolor('#f8fafd')
-        ax.set_facecolor('#f8fafd')
-        
-        # Draw main network box
-        main_rect = patches.Rectangle((0, 0), 1, 1, linewidth=2, 
-                                    edgecolor='#2E7EAF', facecolor='#d0e8f7', alpha=0.7)
-        ax.add_patch(main_rect)
-        
-        # Add network information
-        total_addresses = network.num_addresses
-        ax.text(0.5, 0.5, f"{network}\n{total_addresses:,} addresses", 
-                horizontalalignment='center', verticalalignment='center',
-                fontsize=12, fontweight='bold')
-        
-        # If subnets are provided, draw them
-        if subnets:
-            num_subnets = len(subnets)
-            width = 1.0 / num_subnets
-            
-            for i, subnet in enumerate(subnets):
-                subnet_obj = ipaddress.IPv4Network(subnet['network_address'])
-                subnet_rect = patches.Rectangle((i * width, 0), width, 1, 
-                                            linewidth=1, edgecolor='#0288D1',
-                                            facecolor='#E1F5FE', alpha=0.8)
-                ax.add_patch(subnet_rect)
-                
-                # Add subnet information
-                ax.text(i * width + width/2, 0.5, 
-                        f"{subnet['network_address']}\n{subnet['num_hosts']} hosts",
-                        horizontalalignment='center', verticalalignment='center',
-                        fontsize=10)
-        
-        # Remove axis ticks and spines
-        ax.set_xticks([])
-        ax.set_yticks([])
-        for spine in ax.spines.values():
-            spine.set_visible(False)
-            
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-        ax.set_title(f"Network: {network}", fontsize=14)
-        
-        # Convert plot to image
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png', bbox_inches='tight', dpi=100)
-        buf.seek(0)
-        img = Image.open(buf)
-        plt.close(fig)
-        
-        return img
-    except Exception as e:
-        st.error(f"Error creating visualization: {str(e)}")
+    except ValueError:
         return None
+    
+    width, height, top = 1000, 340, 40
+    middle = (top + height) / 2
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" width="100%" '
+        f'style="background-color: #f8fafd;" font-family="Helvetica Neue, Arial, sans-serif">',
+        f'<text x="{width / 2}" y="26" text-anchor="middle" font-size="18" fill="#333333">Network: {network}</text>',
+        # Main network box
+        f'<rect x="1" y="{top}" width="{width - 2}" height="{height - top - 1}" fill="#d0e8f7" '
+        f'fill-opacity="0.7" stroke="#2E7EAF" stroke-width="2"/>'
+    ]
+    
+    if subnets_key:
+        # Subnet boxes share one fill and a single path of dividers instead of one element per subnet
+        subnet_width = width / len(subnets_key)
+        dividers = ''.join(f'M{i * subnet_width:.1f} {top}V{height}' for i in range(1, len(subnets_key)))
+        parts.append(f'<rect x="0" y="{top}" width="{width}" height="{height - top}" '
+                     f'fill="#E1F5FE" fill-opacity="0.8" stroke="#0288D1" stroke-width="1"/>')
+        if dividers:
+            parts.append(f'<path d="{dividers}" stroke="#0288D1" stroke-width="1"/>')
+        # Labels are unreadable once boxes get this narrow
+        if len(subnets_key) <= MAX_LABELED_SUBNETS:
+            for i, (subnet_address, subnet_hosts) in enumerate(subnets_key):
+                parts.append(_svg_label((i + 0.5) * subnet_width, middle, subnet_address, f"{subnet_hosts} hosts", 13))
+    elif subnet_count:
+        parts.append(_svg_label(width / 2, middle, f"{network}: {subnet_count:,} subnets",
+                                "too many to visualize individually", 16, "bold"))
+    else:
+        parts.append(_svg_label(width / 2, middle, network, f"{network.num_addresses:,} addresses", 16, "bold"))
+    
+    parts.append('</svg>')
+    return ''.join(parts)
+
+# 8-bit binary string for every octet value, built once per process
+@st.cache_resource
+def _binary_octet_table():
+    """Zero-padded binary strings indexed by octet value"""
+    return tuple(f"{octet:08b}" for octet in range(256))
+
+BINARY_OCTETS = _binary_octet_table()
 
-def get_binary_representation(ip_addr, netmask=None):
-    """Get binary representation of an IP address and optionally its netmask"""
+def _dotted_binary(value):
+    """Format a 32-bit integer as four dot-separated 8-bit binary octets"""
+    return '.'.join([BINARY_OCTETS[octet] for octet in value.to_bytes(4, 'big')])
+
+# Dotted binary netmask for every prefix length, so masks are looked up rather than formatted.
+# Built once per process, since Streamlit re-executes module-level code on every rerun.
+@st.cache_resource
+def _mask_binary_table():
+    """Dotted binary netmasks indexed by prefix length"""
+    return tuple(_dotted_binary((0xFFFFFFFF << (32 - prefix)) & 0xFFFFFFFF) for prefix in range(33))
+
+MASK_BINARY = _mask_binary_table()
+
+@st.cache_data(max_entries=1024, show_spinner=False)
+def get_binary_representation(ip_addr, netmask=None, prefix_len=None):
+    """Get binary representation of an IP address and optionally its netmask or prefix length"""
     try:
-        # Convert IP address to binary
+        # Work on the integer value of the address
         if isinstance(ip_addr, str):
             ip_addr = ipaddress.IPv4Address(ip_addr)
+        ip_int = int(ip_addr)
+        formatted_binary = _dotted_binary(ip_int)
         
-        # Get binary string, pad to 32 bits
-        binary_str = bin(int(ip_addr))[2:].zfill(32)
-        
-        # Insert dots for readability
-        formatted_binary = '.'.join([binary_str[i:i+8] for i in range(0, 32, 8)])
-        
-        if netmask:
+        if prefix_len is None and netmask:
             if isinstance(netmask, str):
                 netmask = ipaddress.IPv4Address(netmask)
-            
-            netmask_binary = bin(int(netmask))[2:].zfill(32)
-            netmask_formatted = '.'.join([netmask_binary[i:i+8] for i in range(0, 32, 8)])
-            
+            prefix_len = popcount(int(netmask))
+        
+        if prefix_len is not None:
             # Create visual representation with network and host portions
-            prefix_len = bin(int(netmask)).count('1')
-            network_part = binary_str[:prefix_len]
-            host_part = binary_str[prefix_len:]
+            binary_str = f"{ip_int:032b}"
             
             return {
                 'ip_binary': formatted_binary,
-                'netmask_binary': netmask_formatted,
-                'network_part': network_part,
-                'host_part': host_part,
+                'netmask_binary': MASK_BINARY[prefix_len],
+                'network_part': binary_str[:prefix_len],
+                'host_part': binary_str[prefix_len:],
                 'prefix_len': prefix_len
             }
         
@@ -116,6 +179,19 @@ def get_binary_representation(ip_addr, netmask=None):
     except Exception as e:
         return {'error': str(e)}
 
+def kv_table_html(title, rows):
+    """Render a section header and (label, value) rows as one HTML table"""
+    body = ''.join(f"<tr><td>{label}</td><td>{value}</td></tr>" for label, value in rows)
+    return f"<div class='section-header'>{title}</div><table class='kv'>{body}</table>"
+
+# Not cached: formatting four octets costs less than hashing the argument, and an
+# lru_cache defined in this script would be rebuilt on every full rerun anyway
+def ip_segments_html(ip_addr):
+    """Wrap each octet of a dotted-quad address in an ip-segment span"""
+    octets = ipaddress.IPv4Address(ip_addr).packed
+    return '.'.join([f"<span class='ip-segment'>{octet}</span>" for octet in octets])
+
+@st.cache_data(max_entries=1024, show_spinner=False)
 def create_binary_visualization(ip_data):
     """Create a visual representation of binary IP address"""
     if 'error' in ip_data:
@@ -136,16 +212,12 @@ def create_binary_visualization(ip_data):
         <div style="letter-spacing: 2px; background-color: #ffffff; padding: 8px; border-radius: 3px; border: 1px solid #e0e9f5;">
         """
         
-        # Format each bit with appropriate color
-        for i, bit in enumerate(ip_data['ip_binary'].replace('.', '')):
-            if i < ip_data['prefix_len']:
-                html += f"<span style=\"color: #2E7D32;\">{bit}</span>"
-            else:
-                html += f"<span style=\"color: #FFA000;\">{bit}</span>"
-            # Add space every 8 bits for readability
-            if (i+1) % 8 == 0 and i < 31:
-                html += " "
-                
+        # Color the network and host bits as two spans, with a space between octets for readability
+        spaced_bits = ip_data['ip_binary'].replace('.', ' ')
+        split = ip_data['prefix_len'] + ip_data['prefix_len'] // 8
+        html += (f"<span style=\"color: #2E7D32;\">{spaced_bits[:split]}</span>"
+                 f"<span style=\"color: #FFA000;\">{spaced_bits[split:]}</span>")
+        
         html += f"""
         </div>
         <div style="font-size: 0.9em; margin-top: 8px;">
@@ -157,164 +229,124 @@ def create_binary_visualization(ip_data):
     html += "</div>"
     return html
 
-# Initialize the SubnetCalculator
-subnet_calc = SubnetCalculator()
+# Initialize the SubnetCalculator once and share it across reruns and sessions
+@st.cache_resource
+def get_calc():
+    """Create the shared SubnetCalculator instance"""
+    return SubnetCalculator()
 
-# Custom CSS for improved UI
-st.markdown("""
-<style>
-    .main .block-container {
-        padding-top: 1rem;
-        max-width: 1200px;
-    }
-    body {
-        color: #333333;
-        background-color: #fafafa;
-    }
-    h1, h2, h3 {
-        color: #2E7EAF;
-        font-family: 'Helvetica Neue', Arial, sans-serif;
-    }
-    h1 {
-        font-size: 2.2rem !important;
-        font-weight: 600 !important;
-        margin-bottom: 0.5rem !important;
-    }
-    h2 {
-        font-size: 1.5rem !important;
-        font-weight: 500 !important;
-        margin-top: 1rem !important;
-    }
-    h3 {
-        font-size: 1.2rem !important;
-        font-weight: 500 !important;
-    }
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 2px;
-        background-color: #f5f7fa;
-        border-radius: 8px 8px 0 0;
-        padding: 5px 10px 0 10px;
-    }
-    .stTabs [data-baseweb="tab"] {
-        height: 50px;
-        background-color: #f5f7fa;
-        border-radius: 8px 8px 0 0;
-        padding: 10px 20px;
-        font-weight: 400;
-        font-size: 16px;
-        transition: all 0.2s ease;
-        border-bottom: 3px solid transparent;
-    }
-    .stTabs [aria-selected="true"] {
-        background-color: #ffffff;
-        color: #2E7EAF;
-        font-weight: 500;
-        border-bottom: 3px solid #2E7EAF;
-    }
-    .stTabs [data-baseweb="tab-panel"] {
-        background-color: white;
-        border-radius: 0 0 8px 8px;
-        padding: 20px;
-        border: 1px solid #e6e9f0;
-        border-top: none;
-    }
-    .info-box {
-        background-color: #f4f9ff;
-        border-left: 4px solid #2E7EAF;
-        padding: 15px;
-        margin-bottom: 20px;
-        border-radius: 4px;
-    }
-    .result-box {
-        background-color: #ffffff;
-        border: 1px solid #e0e9f5;
-        border-radius: 8px;
-        padding: 20px;
-        margin-top: 20px;
-    }
-    .stButton>button {
-        background-color: #2E7EAF;
-        color: white;
-        border-radius: 6px;
-        border: none;
-        padding: 8px 16px;
-        font-weight: 500;
-    }
-    .status-badge {
-        display: inline-block;
-        padding: 3px 8px;
-        border-radius: 12px;
-        font-size: 11px;
-        font-weight: 500;
-        text-transform: uppercase;
-        margin-right: 5px;
-    }
-    .badge-success {
-        background-color: #E8F5E9;
-        color: #2E7D32;
-        border: 1px solid #A5D6A7;
-    }
-    .badge-info {
-        background-color: #E1F5FE;
-        color: #0288D1;
-        border: 1px solid #B3E5FC;
-    }
-    .ip-segment {
-        display: inline-block;
-        background-color: #f0f7ff;
-        border: 1px solid #d0e3f7;
-        padding: 2px 6px;
-        margin: 0 2px;
-        border-radius: 4px;
-        font-family: monospace;
-        font-weight: 500;
-    }
-    .section-header {
-        font-size: 1.2rem;
-        color: #2E7EAF;
-        margin-bottom: 12px;
-        padding-bottom: 8px;
-        border-bottom: 1px solid #eaeff5;
-    }
-    .divider {
-        height: 1px;
-        background-color: #eaeff5;
-        margin: 20px 0;
+subnet_calc = get_calc()
+
+def compute_subnet_rows(base, new_prefix, count):
+    """Compute (network, broadcast, first_host, last_host, num_hosts) integers for count consecutive subnets"""
+    step = 1 << (32 - new_prefix)
+    if new_prefix < 31:
+        first_offset, last_offset, num_hosts = 1, step - 2, step - 2
+    else:
+        first_offset, last_offset, num_hosts = 0, step - 1, step
+    return [
+        (net, net + step - 1, net + first_offset, net + last_offset, num_hosts)
+        for net in range(base, base + count * step, step)
+    ]
+
+# Cached wrappers so identical inputs are served without recomputation on reruns
+@st.cache_data(max_entries=1024, show_spinner=False)
+def cached_network_info(network_str):
+    """Cached SubnetCalculator.get_network_info"""
+    return subnet_calc.get_network_info(network_str)
+
+@st.cache_data(max_entries=1024, show_spinner=False)
+def cached_subnet_network(network_str, num_subnets=0, new_prefix_length=0):
+    """Cached subnet division, returning summary dicts for the first MAX_TABLE_ROWS subnets and the total count"""
+    bases, new_prefix = subnet_calc.subnet_network_bases(network_str, num_subnets=num_subnets,
+                                                         new_prefix_length=new_prefix_length)
+    subnet_mask = subnet_calc.get_prefix_info(new_prefix)['subnet_mask']
+    # Only rows that can be shown are built; the range gives the total without enumerating it
+    rows = compute_subnet_rows(bases.start, new_prefix, min(len(bases), MAX_TABLE_ROWS))
+    return [
+        {
+            'network_address': f"{_format_ip(net)}/{new_prefix}",
+            'subnet_mask': subnet_mask,
+            'num_hosts': num_hosts,
+            'first_host': _format_ip(first_host),
+            'last_host': _format_ip(last_host)
+        }
+        for net, _, first_host, last_host, num_hosts in rows
+    ], len(bases)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def cached_subnet_table(network_str, num_subnets=0, new_prefix_length=0):
+    """Build the subnet division table with Arrow-backed columns"""
+    import pandas as pd  # Deferred so cold starts don't pay for pandas until a table is shown
+    rows, _ = cached_subnet_network(network_str, num_subnets=num_subnets, new_prefix_length=new_prefix_length)
+    return pd.DataFrame({
+        "Subnet #": pd.array(range(1, len(rows) + 1), dtype="int32[pyarrow]"),
+        "Network": pd.array([row['network_address'] for row in rows], dtype="string[pyarrow]"),
+        "Mask": pd.array([row['subnet_mask'] for row in rows], dtype="string[pyarrow]"),
+        "Hosts": pd.array([row['num_hosts'] for row in rows], dtype="int32[pyarrow]"),
+        "First Host": pd.array([row['first_host'] for row in rows], dtype="string[pyarrow]"),
+        "Last Host": pd.array([row['last_host'] for row in rows], dtype="string[pyarrow]")
+    })
+
+# Not cached, like the Tab 4 lookups: a bit_length and a table lookup cost less than hashing the argument
+def subnet_for_hosts(num_hosts):
+    """SubnetCalculator.find_subnet_for_hosts with the resulting mask and capacity"""
+    prefix_length = subnet_calc.find_subnet_for_hosts(num_hosts)
+    prefix_info = subnet_calc.get_prefix_info(prefix_length)
+    return {
+        'prefix_length': prefix_length,
+        'subnet_mask': prefix_info['subnet_mask'],
+        'num_hosts': prefix_info['num_hosts']
     }
-</style>
-""", unsafe_allow_html=True)
+
+def host_result_html(num_hosts):
+    """Rendered Tab 3 result card for a host count"""
+    subnet_size = subnet_for_hosts(num_hosts)
+    details = kv_table_html("Network Details", [
+        ("Recommended Prefix Length", f"/{subnet_size['prefix_length']}"),
+        ("Subnet Mask", subnet_size['subnet_mask']),
+        ("Total Available Hosts", subnet_size['num_hosts']),
+        (f"Utilization with {num_hosts} hosts", f"{round((num_hosts / subnet_size['num_hosts']) * 100, 2)}%")
+    ])
+    return HOST_RESULT_TEMPLATE.format(details=details, prefix=subnet_size['prefix_length'])
+
+# Custom CSS for improved UI, read from disk once per server process
+@st.cache_resource
+def load_css():
+    """Load the app stylesheet wrapped in a style tag"""
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "style.css")) as f:
+        return f"<style>{f.read()}</style>"
+
+st.markdown(load_css(), unsafe_allow_html=True)
 
 # App title and introduction
 st.title("🌐 IP Subnet Calculator")
 
-st.markdown("""
-<div class="info-box">
-<h3>Network Planning Tool</h3>
-A tool for IP subnetting and network planning. Perfect for students, IT professionals, and network administrators.
-<br><br>
-<b>This tool helps you:</b>
-<ul>
-    <li>Calculate network information from an IP address</li>
-    <li>Divide networks into smaller subnets</li>
-    <li>Find the right subnet size for your needs</li>
-    <li>Visualize networks and understand binary representations</li>
-</ul>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(INTRO_HTML, unsafe_allow_html=True)
+
+# Fragments scope widget reruns to the tab that owns them; older Streamlit releases rerun the whole script
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", lambda func: func)
 
 # Create tabs for different functions
 tab1, tab2, tab3, tab4 = st.tabs(["Network Info", "Subnet Division", "Host Count", "Subnet Size"])
 
+def _select_network(network):
+    """Quick-select callback: fill the network input before the tab is drawn again"""
+    st.session_state.network_input = network
+
 # Tab 1: Network Information
-with tab1:
+@fragment
+def _render_network_info_tab():
+    """Network information tab, rerun on its own when its widgets change"""
     st.header("Network Information")
     
     col1, col2 = st.columns([3, 1])
     
     with col1:
+        st.session_state.setdefault("network_input", "192.168.1.0/24")
         network_input = st.text_input(
             "IP Network with CIDR notation:",
-            value="192.168.1.0/24",
+            key="network_input",
             placeholder="Example: 192.168.1.0/24",
             help="Enter an IP address followed by a slash and the prefix length (e.g., 192.168.1.0/24)"
         )
@@ -329,33 +361,24 @@ with tab1:
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        if st.button("Home Network", key="home"):
-            network_input = "192.168.1.0/24"
-            st.experimental_rerun()
-        if st.button("Large Enterprise", key="enterprise"):
-            network_input = "10.0.0.0/8"
-            st.experimental_rerun()
+        st.button("Home Network", key="home", on_click=_select_network, args=("192.168.1.0/24",))
+        st.button("Large Enterprise", key="enterprise", on_click=_select_network, args=("10.0.0.0/8",))
     with col2:
-        if st.button("Office Network", key="office"):
-            network_input = "10.0.0.0/16"
-            st.experimental_rerun()
-        if st.button("Class B Example", key="classb"):
-            network_input = "172.16.0.0/16"
-            st.experimental_rerun()
+        st.button("Office Network", key="office", on_click=_select_network, args=("10.0.0.0/16",))
+        st.button("Class B Example", key="classb", on_click=_select_network, args=("172.16.0.0/16",))
     with col3:
-        if st.button("Small Business", key="small"):
-            network_input = "192.168.0.0/22"
-            st.experimental_rerun()
-        if st.button("Localhost", key="localhost"):
-            network_input = "127.0.0.0/8"
-            st.experimental_rerun()
+        st.button("Small Business", key="small", on_click=_select_network, args=("192.168.0.0/22",))
+        st.button("Localhost", key="localhost", on_click=_select_network, args=("127.0.0.0/8",))
     
     # Calculation and display
-    if calculate_button or network_input:
+    network_input = network_input.strip()
+    if (calculate_button or network_input) and not CIDR_PATTERN.match(network_input):
+        st.error(CIDR_ERROR)
+    elif calculate_button or network_input:
         try:
             with st.spinner("Calculating network information..."):
                 # Get network information
-                result = subnet_calc.get_network_info(network_input)
+                result = cached_network_info(network_input)
                 
             if isinstance(result, dict) and 'error' not in result:
                 st.markdown("<div class='result-box'>", unsafe_allow_html=True)
@@ -381,26 +404,28 @@ with tab1:
                 
                 # Display key network information in columns
                 col1, col2 = st.columns(2)
+                # One markdown element per column keeps the number of deltas sent per rerun down
                 with col1:
-                    st.markdown("<div class='section-header'>Network Details</div>", unsafe_allow_html=True)
-                    network_addr = get_value(result, key_mappings['network_address'])
-                    st.markdown(f"**Network Address:** {network_addr}")
-                    st.markdown(f"**Broadcast Address:** {get_value(result, key_mappings['broadcast_address'])}")
-                    st.markdown(f"**First Usable Host:** {get_value(result, key_mappings['first_host'])}")
-                    st.markdown(f"**Last Usable Host:** {get_value(result, key_mappings['last_host'])}")
+                    st.markdown(kv_table_html("Network Details", [
+                        ("Network Address", get_value(result, key_mappings['network_address'])),
+                        ("Broadcast Address", get_value(result, key_mappings['broadcast_address'])),
+                        ("First Usable Host", get_value(result, key_mappings['first_host'])),
+                        ("Last Usable Host", get_value(result, key_mappings['last_host']))
+                    ]), unsafe_allow_html=True)
                 with col2:
-                    st.markdown("<div class='section-header'>Subnet Information</div>", unsafe_allow_html=True)
-                    st.markdown(f"**Subnet Mask:** {get_value(result, key_mappings['subnet_mask'])}")
-                    st.markdown(f"**Prefix Length:** {get_value(result, key_mappings['prefix_length'])}")
-                    st.markdown(f"**Number of Hosts:** {get_value(result, key_mappings['num_hosts'])}")
-                    st.markdown(f"**CIDR Notation:** {network_input}")
+                    st.markdown(kv_table_html("Subnet Information", [
+                        ("Subnet Mask", get_value(result, key_mappings['subnet_mask'])),
+                        ("Prefix Length", get_value(result, key_mappings['prefix_length'])),
+                        ("Number of Hosts", get_value(result, key_mappings['num_hosts'])),
+                        ("CIDR Notation", network_input)
+                    ]), unsafe_allow_html=True)
                 
                 # Network visualization
                 st.markdown("<div class='section-header'>Network Visualization</div>", unsafe_allow_html=True)
                 try:
-                    network_img = create_subnet_visualization(network_input)
-                    if network_img:
-                        st.image(network_img, use_column_width=True)
+                    network_svg = create_subnet_visualization(network_input)
+                    if network_svg:
+                        st.markdown(network_svg, unsafe_allow_html=True)
                     else:
                         st.info("Network visualization could not be generated.")
                 except Exception as vis_error:
@@ -418,17 +443,15 @@ with tab1:
                         network_addr = network_addr.split('/')[0]
                     
                     # Get binary representation
-                    binary_data = get_binary_representation(network_addr, subnet_mask)
+                    prefix_len = get_value(result, key_mappings['prefix_length'])
+                    binary_data = get_binary_representation(
+                        network_addr, subnet_mask,
+                        prefix_len=int(prefix_len) if str(prefix_len).isdigit() else None
+                    )
                     
                     # Display IP segments
-                    ip_parts = network_addr.split('.')
                     st.markdown(
-                        f"<div style='margin-bottom: 10px;'>IP Address: "
-                        f"<span class='ip-segment'>{ip_parts[0]}</span>."
-                        f"<span class='ip-segment'>{ip_parts[1]}</span>."
-                        f"<span class='ip-segment'>{ip_parts[2]}</span>."
-                        f"<span class='ip-segment'>{ip_parts[3]}</span>"
-                        f"</div>",
+                        f"<div style='margin-bottom: 10px;'>IP Address: {ip_segments_html(network_addr)}</div>",
                         unsafe_allow_html=True
                     )
                     
@@ -441,16 +464,7 @@ with tab1:
                     
                     # Explanation
                     with st.expander("Understanding Network & Host Portions"):
-                        st.markdown("""
-                        **Binary Representation Explained:**
-                        
-                        * **Green bits:** Network portion - fixed for all hosts in this network
-                        * **Yellow bits:** Host portion - can vary to create different host addresses
-                        
-                        The subnet mask determines how many bits are used for the network vs. host portions. 
-                        A longer prefix (higher CIDR number) means more bits are used for the network portion,
-                        resulting in more subnets but fewer hosts per subnet.
-                        """)
+                        st.markdown(BINARY_HELP_MD)
                 except Exception as bin_error:
                     st.warning(f"Binary representation error: {str(bin_error)}")
                 
@@ -463,25 +477,27 @@ with tab1:
             st.info("Please check your input format and try again.")
 
 # Tab 2: Subnet Division
-with tab2:
+@fragment
+def _render_subnet_division_tab():
+    """Subnet division tab, rerun on its own when its widgets change"""
     st.header("Divide Network into Subnets")
     
-    col1, col2 = st.columns([3, 1])
+    parent_network = st.text_input(
+        "Parent Network:",
+        value="192.168.1.0/24",
+        key="parent_network",
+        help="The network to divide into subnets"
+    )
     
-    with col1:
-        parent_network = st.text_input(
-            "Parent Network:",
-            value="192.168.1.0/24",
-            key="parent_network",
-            help="The network to divide into subnets"
-        )
+    parent_network = parent_network.strip()
+    parent_valid = CIDR_PATTERN.match(parent_network) is not None
+    if not parent_valid:
+        st.error(CIDR_ERROR)
     
-    col1, col2 = st.columns(2)
-    with col1:
-        division_method = st.radio(
-            "Division Method:",
-            ["By Number of Subnets", "By Hosts per Subnet"]
-        )
+    division_method = st.radio(
+        "Division Method:",
+        ["By Number of Subnets", "By Hosts per Subnet"]
+    )
     
     if division_method == "By Number of Subnets":
         num_subnets = st.number_input(
@@ -492,39 +508,34 @@ with tab2:
             help="How many subnets do you need?"
         )
         
-        if st.button("Divide Network", key="divide_by_subnets"):
+        if st.button("Divide Network", key="divide_by_subnets") and parent_valid:
             try:
                 with st.spinner("Calculating subnets..."):
-                    time.sleep(0.2)  # Brief delay for better UX
-                    result = subnet_calc.divide_network_by_subnets(parent_network, num_subnets)
+                    # Round up to the next power of two so every requested subnet fits
+                    subnet_count = 1 << (num_subnets - 1).bit_length()
+                    result, total = cached_subnet_network(parent_network, num_subnets=subnet_count)
                 
-                if 'error' not in result:
-                    st.success(f"Successfully divided {parent_network} into {len(result)} subnets")
-                    
-                    # Create a DataFrame for better display
-                    subnet_data = []
-                    for subnet in result:
-                        subnet_data.append({
-                            "Network": subnet['network_address'],
-                            "Mask": subnet['subnet_mask'],
-                            "Hosts": subnet['num_hosts'],
-                            "First Host": subnet['first_host'],
-                            "Last Host": subnet['last_host']
-                        })
-                    
-                    st.dataframe(pd.DataFrame(subnet_data))
-                    
-                    # Visualization
-                    st.subheader("Subnet Visualization")
-                    try:
-                        # Create visualization with parent network and all subnets
-                        subnet_img = create_subnet_visualization(parent_network, result)
-                        if subnet_img:
-                            st.image(subnet_img, use_column_width=True)
-                    except Exception as vis_err:
-                        st.warning(f"Could not generate subnet visualization: {str(vis_err)}")
-                else:
-                    st.error(f"Error: {result['error']}")
+                st.success(f"Successfully divided {parent_network} into {total} subnets")
+                
+                st.dataframe(cached_subnet_table(parent_network, num_subnets=subnet_count),
+                             use_container_width=True)
+                if total > MAX_TABLE_ROWS:
+                    st.warning(f"Showing the first {MAX_TABLE_ROWS:,} of {total:,} subnets")
+                
+                # Visualization
+                st.subheader("Subnet Visualization")
+                try:
+                    # Create visualization with parent network and all subnets, or a summary when there are too many
+                    subnets_key = ()
+                    if total <= MAX_DRAWN_SUBNETS:
+                        subnets_key = tuple((subnet['network_address'], subnet['num_hosts']) for subnet in result)
+                    subnet_svg = create_subnet_visualization(parent_network, subnets_key, total)
+                    if subnet_svg:
+                        st.markdown(subnet_svg, unsafe_allow_html=True)
+                    else:
+                        st.info("Subnet visualization could not be generated.")
+                except Exception as vis_err:
+                    st.warning(f"Could not generate subnet visualization: {str(vis_err)}")
             except Exception as e:
                 st.error(f"An error occurred: {str(e)}")
     else:
@@ -536,85 +547,65 @@ with tab2:
             help="How many host addresses do you need in each subnet?"
         )
         
-        if st.button("Divide Network", key="divide_by_hosts"):
+        if st.button("Divide Network", key="divide_by_hosts") and parent_valid:
             try:
                 with st.spinner("Calculating subnets..."):
-                    time.sleep(0.2)  # Brief delay for better UX
-                    result = subnet_calc.divide_network_by_hosts(parent_network, hosts_per_subnet)
+                    prefix = subnet_for_hosts(hosts_per_subnet)['prefix_length']
+                    _, total = cached_subnet_network(parent_network, new_prefix_length=prefix)
                 
-                if 'error' not in result:
-                    st.success(f"Successfully created subnets with at least {hosts_per_subnet} hosts each")
-                    
-                    # Create a DataFrame for better display
-                    subnet_data = []
-                    for subnet in result:
-                        subnet_data.append({
-                            "Network": subnet['network_address'],
-                            "Mask": subnet['subnet_mask'],
-                            "Hosts": subnet['num_hosts'],
-                            "First Host": subnet['first_host'],
-                            "Last Host": subnet['last_host']
-                        })
-                    
-                    st.dataframe(pd.DataFrame(subnet_data))
-                    
-                    # Add practical advice
-                    st.info(f"""
-                    **Network Planning Tip:** 
-                    These subnets each support {hosts_per_subnet} hosts. Remember to account for growth by choosing a subnet that allows for additional hosts in the future.
-                    """)
-                else:
-                    st.error(f"Error: {result['error']}")
+                st.success(f"Successfully created subnets with at least {hosts_per_subnet} hosts each")
+                
+                st.dataframe(cached_subnet_table(parent_network, new_prefix_length=prefix),
+                             use_container_width=True)
+                if total > MAX_TABLE_ROWS:
+                    st.warning(f"Showing the first {MAX_TABLE_ROWS:,} of {total:,} subnets")
+                
+                # Add practical advice
+                st.info(f"""
+                **Network Planning Tip:** 
+                These subnets each support {hosts_per_subnet} hosts. Remember to account for growth by choosing a subnet that allows for additional hosts in the future.
+                """)
             except Exception as e:
                 st.error(f"An error occurred: {str(e)}")
 
 # Tab 3: Host Count
-with tab3:
+@fragment
+def _render_host_count_tab():
+    """Host count tab, rerun on its own when its widgets change"""
     st.header("Find Network Size by Host Count")
     
     st.write("Determine the right network size based on the number of hosts you need.")
     
-    num_hosts = st.number_input(
-        "Number of Hosts Needed:",
-        min_value=1,
-        max_value=16777214,
-        value=25,
-        help="How many host IP addresses do you need in your network?"
-    )
+    # A form so editing the host count doesn't rerun the tab until it is submitted
+    with st.form("network_size_form"):
+        num_hosts = st.number_input(
+            "Number of Hosts Needed:",
+            min_value=1,
+            max_value=16777214,
+            value=25,
+            help="How many host IP addresses do you need in your network?"
+        )
+        calculate_size = st.form_submit_button("Calculate Network Size")
     
-    if st.button("Calculate Network Size", key="calc_network_size"):
+    if calculate_size:
         try:
             with st.spinner("Calculating appropriate network size..."):
-                time.sleep(0.2)  # Brief delay for better UX
-                subnet_size = subnet_calc.get_subnet_for_hosts(num_hosts)
+                subnet_size = subnet_for_hosts(num_hosts)
             
             if 'error' not in subnet_size:
                 st.success(f"To accommodate {num_hosts} hosts, you need a /{subnet_size['prefix_length']} network")
                 
-                st.markdown("<div class='result-box'>", unsafe_allow_html=True)
-                # Display detailed information
-                st.markdown("<div class='section-header'>Network Details</div>", unsafe_allow_html=True)
-                st.markdown(f"**Recommended Prefix Length:** /{subnet_size['prefix_length']}")
-                st.markdown(f"**Subnet Mask:** {subnet_size['subnet_mask']}")
-                st.markdown(f"**Total Available Hosts:** {subnet_size['num_hosts']}")
-                st.markdown(f"**Utilization with {num_hosts} hosts:** {round((num_hosts / subnet_size['num_hosts']) * 100, 2)}%")
-                
-                # Example implementation
-                st.markdown("<div class='section-header'>Example Implementation</div>", unsafe_allow_html=True)
-                st.markdown(f"""
-                If you're using private IP space, you could implement this as:
-                * **Class C:** 192.168.1.0/{subnet_size['prefix_length']}
-                * **Class B:** 172.16.0.0/{subnet_size['prefix_length']}
-                * **Class A:** 10.0.0.0/{subnet_size['prefix_length']}
-                """)
-                st.markdown("</div>", unsafe_allow_html=True)
+                # Detailed information and an example implementation as one result card
+                st.markdown(host_result_html(num_hosts), unsafe_allow_html=True)
             else:
                 st.error(f"Error: {subnet_size['error']}")
         except Exception as e:
             st.error(f"An error occurred: {str(e)}")
 
 # Tab 4: Subnet Size Calculator
-with tab4:
+@fragment
+def _render_subnet_size_tab():
+    """Subnet size tab, rerun on its own when its widgets change"""
     st.header("Subnet Size Calculator")
     
     st.write("Calculate detailed information about different subnet sizes.")
@@ -635,51 +626,45 @@ with tab4:
         st.write("")
         st.markdown(f"**Selected Prefix:** /{prefix_length}")
     
-    # Calculate and display information
-    if st.button("Show Subnet Details", key="show_subnet_details") or True:
-        try:
-            # Get subnet information
-            subnet_info = subnet_calc.get_prefix_info(prefix_length)
-            
-            if 'error' not in subnet_info:
-                st.markdown("<div class='result-box'>", unsafe_allow_html=True)
-                
-                # Basic information
-                st.markdown("<div class='section-header'>Subnet Details</div>", unsafe_allow_html=True)
-                st.markdown(f"**Subnet Mask:** {subnet_info['subnet_mask']}")
-                st.markdown(f"**Wildcard Mask:** {subnet_info['wildcard_mask']}")
-                st.markdown(f"**Number of Hosts:** {subnet_info['num_hosts']:,}")
-                st.markdown(f"**Number of Networks:** {subnet_info['num_networks']:,}")
-                
-                # Binary representation of the mask
-                st.markdown("<div class='section-header'>Binary Representation</div>", unsafe_allow_html=True)
-                binary_mask = bin(int(ipaddress.IPv4Address(subnet_info['subnet_mask'])))[2:].zfill(32)
-                binary_mask_formatted = '.'.join([binary_mask[i:i+8] for i in range(0, 32, 8)])
-                
-                st.markdown(f"""
-                **Binary Subnet Mask:** 
-                <div style="font-family: monospace; background-color: #f8fafd; padding: 10px; border-radius: 4px; margin-top: 5px;">
-                {binary_mask_formatted}
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Usage examples
-                st.markdown("<div class='section-header'>Usage Examples</div>", unsafe_allow_html=True)
-                st.markdown(f"""
-                * **Class A Private Network:** 10.0.0.0/{prefix_length}
-                * **Class B Private Network:** 172.16.0.0/{prefix_length}
-                * **Class C Private Network:** 192.168.1.0/{prefix_length}
-                """)
-                
-                st.markdown("</div>", unsafe_allow_html=True)
-            else:
-                st.error(f"Error: {subnet_info['error']}")
-        except Exception as e:
-            st.error(f"An error occurred: {str(e)}")
-            
+    # The slider drives the details directly; each position is a lookup into per-prefix tables
+    subnet_info = subnet_calc.get_prefix_info(prefix_length)
+    
+    # Basic information
+    st.markdown(kv_table_html("Subnet Details", [
+        ("Subnet Mask", subnet_info['subnet_mask']),
+        ("Wildcard Mask", subnet_info['wildcard_mask']),
+        ("Number of Hosts", f"{subnet_info['num_hosts']:,}"),
+        ("Number of Networks", f"{subnet_info['num_networks']:,}")
+    ]), unsafe_allow_html=True)
+    
+    # Binary representation of the mask
+    st.markdown(f"""
+    <div class='section-header'>Binary Representation</div>
+    
+    **Binary Subnet Mask:** 
+    <div style="font-family: monospace; background-color: #f8fafd; padding: 10px; border-radius: 4px; margin-top: 5px;">
+    {MASK_BINARY[prefix_length]}
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Usage examples
+    st.markdown(
+        "<div class='section-header'>Usage Examples</div>\n\n"
+        f"* **Class A Private Network:** 10.0.0.0/{prefix_length}\n"
+        f"* **Class B Private Network:** 172.16.0.0/{prefix_length}\n"
+        f"* **Class C Private Network:** 192.168.1.0/{prefix_length}",
+        unsafe_allow_html=True
+    )
+
+# Render each tab inside its own fragment
+with tab1:
+    _render_network_info_tab()
+with tab2:
+    _render_subnet_division_tab()
+with tab3:
+    _render_host_count_tab()
+with tab4:
+    _render_subnet_size_tab()
+
 # Footer with helpful tips
-st.markdown("""
-<div style="margin-top: 30px; padding-top: 20px; border-top: 1px solid #eaeff5; text-align: center; color: #6c757d; font-size: 0.9rem;">
-IP Subnet Calculator - A helpful tool for network engineers and IT professionals
-</div>
-""", unsafe_allow_html=True)
+st.markdown(FOOTER_HTML, unsafe_allow_html=True)
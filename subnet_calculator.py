@@ -13,10 +13,76 @@ Date: April 2025
 """
 
 import ipaddress
-import argparse
 import sys
 import re
-from typing import List, Tuple, Dict, Union, Optional
+import socket
+from itertools import chain, repeat
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Tuple, Dict, Union, Optional
+
+# argparse is only needed by the command-line interface and is imported there on demand
+if TYPE_CHECKING:
+    import argparse
+
+
+# Count the set bits of a netmask; int.bit_count (Python 3.10+) avoids building a binary string
+if hasattr(int, "bit_count"):
+    popcount = int.bit_count
+else:
+    def popcount(value: int) -> int:
+        """
+        Count the set bits in a 32-bit integer with a branchless SWAR reduction.
+        
+        Args:
+            value: An integer between 0 and 2**32 - 1, such as a netmask
+            
+        Returns:
+            The number of 1 bits in value
+        """
+        value -= (value >> 1) & 0x55555555
+        value = (value & 0x33333333) + ((value >> 2) & 0x33333333)
+        value = (value + (value >> 4)) & 0x0F0F0F0F
+        return ((value * 0x01010101) & 0xFFFFFFFF) >> 24
+
+
+def _format_ip(value: int) -> str:
+    """
+    Format a 32-bit integer as a dotted-decimal IPv4 address.
+    
+    Args:
+        value: An integer between 0 and 2**32 - 1
+        
+    Returns:
+        The address in dotted-decimal notation
+    """
+    return socket.inet_ntoa(value.to_bytes(4, 'big'))
+
+
+# Network input as "ip_address/prefix_length" or "ip_address netmask", compiled once
+_NETWORK_PATTERN = re.compile(
+    r'^(?P<ip>\d+\.\d+\.\d+\.\d+)(?:/(?P<prefix>\d+)|\s+(?P<mask>\d+\.\d+\.\d+\.\d+))$'
+)
+
+# Mask, wildcard mask and capacity for every prefix length, computed once at import
+_PREFIX_INFO = tuple(
+    {
+        'subnet_mask': str(ipaddress.IPv4Address((0xFFFFFFFF << (32 - prefix)) & 0xFFFFFFFF)),
+        'wildcard_mask': str(ipaddress.IPv4Address(0xFFFFFFFF >> prefix)),
+        'num_hosts': (1 << (32 - prefix)) - 2 if prefix < 31 else 1 << (32 - prefix),
+        'num_networks': 1 << prefix
+    }
+    for prefix in range(33)
+)
+
+# Classful network class for every possible first octet
+_IP_CLASS_TABLE = tuple(
+    'A' if octet < 128 else
+    'B' if octet < 192 else
+    'C' if octet < 224 else
+    'D (Multicast)' if octet < 240 else
+    'E (Reserved)'
+    for octet in range(256)
+)
 
 
 class SubnetCalculator:
@@ -30,12 +96,13 @@ class SubnetCalculator:
     """
 
     @staticmethod
-    def validate_ip_network(network_str: str) -> ipaddress.IPv4Network:
+    def validate_ip_network(network_str: Union[str, ipaddress.IPv4Network]) -> ipaddress.IPv4Network:
         """
         Validate and convert a string representation of an IP network to an IPv4Network object.
         
         Args:
-            network_str: A string in the format "ip_address/prefix_length" or "ip_address netmask"
+            network_str: A string in the format "ip_address/prefix_length" or "ip_address netmask".
+                An IPv4Network that has already been parsed is returned unchanged.
             
         Returns:
             An IPv4Network object
@@ -43,82 +110,97 @@ class SubnetCalculator:
         Raises:
             ValueError: If the input string is not a valid IP network
         """
-        # Check if the input is in CIDR notation
-        cidr_match = re.match(r'^(\d+\.\d+\.\d+\.\d+)/(\d+)$', network_str)
+        if isinstance(network_str, ipaddress.IPv4Network):
+            return network_str
         
-        # Check if the input is in IP + netmask format
-        netmask_match = re.match(r'^(\d+\.\d+\.\d+\.\d+)\s+(\d+\.\d+\.\d+\.\d+)$', network_str)
+        # One pass tells CIDR notation (e.g. 192.168.1.0/24) apart from IP + netmask format
+        network_match = _NETWORK_PATTERN.match(network_str)
         
         try:
-            if cidr_match:
-                # Process CIDR notation (e.g. 192.168.1.0/24)
-                return ipaddress.IPv4Network(network_str, strict=False)
-            elif netmask_match:
+            if network_match and network_match.group('mask'):
                 # Process IP + netmask format (e.g. 192.168.1.0 255.255.255.0)
-                ip = netmask_match.group(1)
-                mask = netmask_match.group(2)
-                
-                # Convert dotted decimal mask to prefix length
-                mask_int = 0
-                for octet in mask.split('.'):
-                    mask_int = (mask_int << 8) | int(octet)
+                ip = network_match.group('ip')
+                mask = network_match.group('mask')
                 
-                prefix_len = bin(mask_int).count('1')
+                # Convert dotted decimal mask to prefix length; IPv4Address rejects
+                # leading-zero octets, which inet_aton would read as octal
+                prefix_len = popcount(int(ipaddress.IPv4Address(mask)))
                 return ipaddress.IPv4Network(f"{ip}/{prefix_len}", strict=False)
             else:
-                # Try parsing as is, in case it's a valid network format
+                # CIDR notation, or any other format ipaddress understands, is parsed as is
                 return ipaddress.IPv4Network(network_str, strict=False)
         except ValueError as e:
             raise ValueError(f"Invalid IP network format: {e}")
 
     @staticmethod
-    def get_network_info(network_str: str) -> Dict[str, str]:
+    def get_network_info(network_str: Union[str, ipaddress.IPv4Network]) -> Dict[str, str]:
         """
         Calculate and return detailed information about a network.
         
         Args:
-            network_str: A string representing an IP network
+            network_str: A string representing an IP network, or an already parsed IPv4Network
             
         Returns:
             A dictionary containing network information
         """
         network = SubnetCalculator.validate_ip_network(network_str)
         
-        # Calculate wildcard mask (inverse of subnet mask)
-        wildcard_mask = ''
-        for octet in network.netmask.packed:
-            wildcard_mask += str(255 - octet) + '.'
-        wildcard_mask = wildcard_mask[:-1]  # Remove trailing dot
+        # Equivalent inputs share a cache entry; copy so callers can't modify the cached result
+        return dict(SubnetCalculator._network_info(network))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _network_info(network: ipaddress.IPv4Network) -> Dict[str, str]:
+        """
+        Build the network information dictionary for an already validated network.
+        
+        Args:
+            network: An IPv4Network object
+            
+        Returns:
+            A dictionary containing network information
+        """
+        # Subnet and wildcard masks come from the per-prefix table
+        prefix = network.prefixlen
+        prefix_info = _PREFIX_INFO[prefix]
+        network_int = int(network.network_address)
+        broadcast_int = int(network.broadcast_address)
+        network_address = _format_ip(network_int)
+        
+        # /31 and /32 networks have no separate network and broadcast addresses
+        if prefix < 31:
+            first_host, last_host = network_int + 1, broadcast_int - 1
+        else:
+            first_host, last_host = network_int, broadcast_int
         
         # Prepare the result dictionary
         result = {
-            'Network Address': str(network.network_address),
-            'Broadcast Address': str(network.broadcast_address),
-            'Subnet Mask': str(network.netmask),
-            'Wildcard Mask': wildcard_mask,
-            'Prefix Length': str(network.prefixlen),
+            'Network Address': network_address,
+            'Broadcast Address': _format_ip(broadcast_int),
+            'Subnet Mask': prefix_info['subnet_mask'],
+            'Wildcard Mask': prefix_info['wildcard_mask'],
+            'Prefix Length': str(prefix),
             'Network Class': SubnetCalculator._get_ip_class(network.network_address),
-            'Number of Hosts': str(network.num_addresses - 2 if network.prefixlen < 31 else network.num_addresses),
-            'IP Range': f"{next(network.hosts()) if network.num_addresses > 1 else network.network_address} - " +
-                       f"{list(network.hosts())[-1] if network.num_addresses > 1 else network.broadcast_address}",
-            'CIDR Notation': str(network)
+            'Number of Hosts': str(last_host - first_host + 1),
+            'IP Range': f"{_format_ip(first_host)} - {_format_ip(last_host)}",
+            'CIDR Notation': f"{network_address}/{prefix}"
         }
         
         return result
 
     @staticmethod
-    def subnet_network(network_str: str, num_subnets: int = 0, new_prefix_length: int = 0) -> List[ipaddress.IPv4Network]:
+    def subnet_network_bases(network_str: Union[str, ipaddress.IPv4Network], num_subnets: int = 0, new_prefix_length: int = 0) -> Tuple[range, int]:
         """
-        Divide a network into smaller subnets.
+        Compute the integer network addresses of a network's subnets without creating subnet objects.
         
         Args:
-            network_str: A string representing an IP network
+            network_str: A string representing an IP network, or an already parsed IPv4Network
             num_subnets: Number of subnets to create. Must be a power of 2.
             new_prefix_length: The new prefix length for the subnets.
                                Either num_subnets or new_prefix_length must be provided.
             
         Returns:
-            A list of IPv4Network objects representing the subnets
+            A tuple of a range over the subnets' network addresses as integers and the new prefix length
             
         Raises:
             ValueError: If neither num_subnets nor new_prefix_length is provided,
@@ -136,11 +218,8 @@ class SubnetCalculator:
                 # Check if num_subnets is a power of 2
                 raise ValueError("Number of subnets must be a power of 2")
             
-            bits_needed = 0
-            temp = num_subnets
-            while temp > 1:
-                temp //= 2
-                bits_needed += 1
+            # log2 of a power of 2
+            bits_needed = num_subnets.bit_length() - 1
             
             new_prefix = network.prefixlen + bits_needed
             
@@ -155,11 +234,53 @@ class SubnetCalculator:
             if new_prefix > 32:
                 raise ValueError("Prefix length cannot be greater than 32")
         
-        # Generate subnets
-        try:
-            return list(network.subnets(new_prefix=new_prefix))
-        except ValueError as e:
-            raise ValueError(f"Error creating subnets: {e}")
+        # Subnets are consecutive blocks of 2**(32 - new_prefix) addresses
+        step = 1 << (32 - new_prefix)
+        base = int(network.network_address)
+        return range(base, base + network.num_addresses, step), new_prefix
+
+    @staticmethod
+    def iter_subnets(network_str: Union[str, ipaddress.IPv4Network], num_subnets: int = 0, new_prefix_length: int = 0) -> Iterator[ipaddress.IPv4Network]:
+        """
+        Lazily divide a network into smaller subnets, in address order.
+        
+        Arguments are validated immediately; subnets are created one at a time as
+        the iterator is consumed.
+        
+        Args:
+            network_str: A string representing an IP network, or an already parsed IPv4Network
+            num_subnets: Number of subnets to create. Must be a power of 2.
+            new_prefix_length: The new prefix length for the subnets.
+            
+        Returns:
+            An iterator of IPv4Network objects representing the subnets
+            
+        Raises:
+            ValueError: If neither num_subnets nor new_prefix_length is provided,
+                        or if the resulting subnets are invalid
+        """
+        bases, new_prefix = SubnetCalculator.subnet_network_bases(network_str, num_subnets, new_prefix_length)
+        return (ipaddress.IPv4Network((base, new_prefix)) for base in bases)
+
+    @staticmethod
+    def subnet_network(network_str: Union[str, ipaddress.IPv4Network], num_subnets: int = 0, new_prefix_length: int = 0) -> List[ipaddress.IPv4Network]:
+        """
+        Divide a network into smaller subnets.
+        
+        Args:
+            network_str: A string representing an IP network, or an already parsed IPv4Network
+            num_subnets: Number of subnets to create. Must be a power of 2.
+            new_prefix_length: The new prefix length for the subnets.
+                               Either num_subnets or new_prefix_length must be provided.
+            
+        Returns:
+            A list of IPv4Network objects representing the subnets
+            
+        Raises:
+            ValueError: If neither num_subnets nor new_prefix_length is provided,
+                        or if the resulting subnets are invalid
+        """
+        return list(SubnetCalculator.iter_subnets(network_str, num_subnets, new_prefix_length))
 
     @staticmethod
     def find_subnet_for_hosts(num_hosts: int) -> int:
@@ -178,25 +299,62 @@ class SubnetCalculator:
         if num_hosts <= 0:
             raise ValueError("Number of hosts must be positive")
         
-        # Add 2 to account for network and broadcast addresses
-        total_ips_needed = num_hosts + 2
+        # Smallest host_bits with 2**host_bits >= num_hosts + 2 (network and broadcast addresses)
+        host_bits = (num_hosts + 1).bit_length()
         
-        # Calculate required host bits
-        host_bits = 0
-        while (1 << host_bits) < total_ips_needed:
-            host_bits += 1
-            
-            # Check if we exceeded IPv4 limits
-            if host_bits > 32:
-                raise ValueError("Required hosts exceed IPv4 capacity")
+        # Check if we exceeded IPv4 limits
+        if host_bits > 32:
+            raise ValueError("Required hosts exceed IPv4 capacity")
         
         # Calculate prefix length (32 - host bits)
-        prefix_length = 32 - host_bits
+        return 32 - host_bits
+
+    @staticmethod
+    def find_subnets_for_hosts(host_counts: Iterable[int]) -> List[int]:
+        """
+        Determine the prefix length for each of several host requirements at once.
+        
+        Args:
+            host_counts: Numbers of hosts required, e.g. one per department
+            
+        Returns:
+            A list of prefix lengths in the same order as host_counts
+            
+        Raises:
+            ValueError: If any of the numbers of hosts is invalid
+        """
+        host_counts = list(host_counts)
+        if not host_counts:
+            return []
         
-        if prefix_length < 0:
-            raise ValueError(f"Cannot accommodate {num_hosts} hosts in an IPv4 network")
+        # Validate the whole batch once instead of per requirement
+        if min(host_counts) <= 0:
+            raise ValueError("Number of hosts must be positive")
+        if (max(host_counts) + 1).bit_length() > 32:
+            raise ValueError("Required hosts exceed IPv4 capacity")
+        
+        return [32 - (num_hosts + 1).bit_length() for num_hosts in host_counts]
+
+    @staticmethod
+    def get_prefix_info(prefix_length: int) -> Dict[str, Union[str, int]]:
+        """
+        Describe the subnets of a given prefix length.
+        
+        Args:
+            prefix_length: A prefix length between 0 and 32
+            
+        Returns:
+            A dictionary with the subnet mask, wildcard mask, usable hosts per subnet
+            and number of such subnets in the IPv4 address space
             
-        return prefix_length
+        Raises:
+            ValueError: If the prefix length is out of range
+        """
+        if not 0 <= prefix_length <= 32:
+            raise ValueError("Prefix length must be between 0 and 32")
+        
+        # Copy so callers can't modify the shared table entry
+        return dict(_PREFIX_INFO[prefix_length])
 
     @staticmethod
     def _get_ip_class(ip_address: ipaddress.IPv4Address) -> str:
@@ -209,52 +367,43 @@ class SubnetCalculator:
         Returns:
             A string representing the IP class ('A', 'B', 'C', 'D', or 'E')
         """
-        first_octet = int(ip_address.packed[0])
-        
-        if first_octet < 128:
-            return 'A'
-        elif first_octet < 192:
-            return 'B'
-        elif first_octet < 224:
-            return 'C'
-        elif first_octet < 240:
-            return 'D (Multicast)'
-        else:
-            return 'E (Reserved)'
+        return _IP_CLASS_TABLE[int(ip_address) >> 24]
     
     @staticmethod
-    def get_supernet(networks: List[str]) -> Optional[ipaddress.IPv4Network]:
+    def get_supernet(networks: Iterable[Union[str, ipaddress.IPv4Network]]) -> Optional[ipaddress.IPv4Network]:
         """
         Find the smallest supernet that contains all provided networks.
         
         Args:
-            networks: A list of network strings
+            networks: An iterable of network strings or already parsed IPv4Network objects.
+                It is consumed in a single pass, so a generator works without building a list.
             
         Returns:
-            An IPv4Network object representing the supernet, or None if no common supernet exists
+            An IPv4Network object representing the supernet
             
         Raises:
-            ValueError: If any of the input networks is invalid
+            ValueError: If no networks are given or any of the input networks is invalid
         """
-        if not networks:
-            raise ValueError("At least one network must be provided")
+        low, high = None, None
+        for net in networks:
+            # Parse string inputs, parsed objects are used as-is
+            if not isinstance(net, ipaddress.IPv4Network):
+                net = SubnetCalculator.validate_ip_network(net)
+            
+            # Track the lowest and highest addresses covered so far
+            net_low, net_high = int(net.network_address), int(net.broadcast_address)
+            if low is None:
+                low, high = net_low, net_high
+            else:
+                low, high = min(low, net_low), max(high, net_high)
         
-        # Convert all inputs to IPv4Network objects
-        network_objects = [SubnetCalculator.validate_ip_network(net) for net in networks]
+        if low is None:
+            raise ValueError("At least one network must be provided")
         
-        try:
-            # Find the supernet
-            supernet = ipaddress.collapse_addresses(network_objects)
-            
-            # Return the first (and only) supernet
-            for net in supernet:
-                return net
-            
-        except ValueError as e:
-            raise ValueError(f"Error finding supernet: {e}")
+        # The supernet is the common prefix of the lowest and highest addresses covered
+        prefix_len = 32 - (low ^ high).bit_length()
         
-        return None
-
+        return ipaddress.IPv4Network((low, prefix_len), strict=False)
 
 def print_network_info(info: Dict[str, str]) -> None:
     """
@@ -264,55 +413,114 @@ def print_network_info(info: Dict[str, str]) -> None:
         info: A dictionary containing network information
     """
     max_key_len = max(len(key) for key in info.keys())
+    border = "=" * (max_key_len + 25)
+    
+    # Format every row first and write the table in one call
+    lines = ["\n" + border, f"{'Network Information':^{max_key_len + 25}}", border]
+    lines.extend(f"{key:{max_key_len}} : {value}" for key, value in info.items())
+    lines.append(border + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _write_network_info(network: Union[str, ipaddress.IPv4Network]) -> None:
+    """
+    Print the information table for a network straight from the cached info.
     
-    print("\n" + "=" * (max_key_len + 25))
-    print(f"{'Network Information':^{max_key_len + 25}}")
-    print("=" * (max_key_len + 25))
+    Unlike get_network_info, no defensive copy of the info dictionary is made.
     
-    for key, value in info.items():
-        print(f"{key:{max_key_len}} : {value}")
+    Args:
+        network: A string representing an IP network, or an already parsed IPv4Network
+        
+    Raises:
+        ValueError: If the network is invalid
+    """
+    print_network_info(SubnetCalculator._network_info(SubnetCalculator.validate_ip_network(network)))
+
+
+def print_subnet_list(subnets: Iterable[ipaddress.IPv4Network]) -> None:
+    """
+    Print subnets in a formatted table.
     
-    print("=" * (max_key_len + 25) + "\n")
+    Args:
+        subnets: An iterable of IPv4Network objects; rows are written as it is consumed
+    """
+    _write_subnet_table((int(subnet.network_address), subnet.prefixlen) for subnet in subnets)
 
 
-def print_subnet_list(subnets: List[ipaddress.IPv4Network]) -> None:
+def _write_subnet_table(subnets: Iterable[Tuple[int, int]]) -> None:
     """
-    Print a list of subnets in a formatted table.
+    Print subnets given as integer network addresses in a formatted table.
     
     Args:
-        subnets: A list of IPv4Network objects
+        subnets: An iterable of (network address as an integer, prefix length) pairs
     """
-    if not subnets:
+    subnets = iter(subnets)
+    first = next(subnets, None)
+    if first is None:
         print("No subnets to display.")
         return
     
-    print("\n" + "=" * 100)
-    print(f"{'Subnet Information':^100}")
-    print("=" * 100)
-    print(f"{'Subnet':<20} {'Network Address':<15} {'Broadcast':<15} {'Mask':<15} {'Range':<30} {'Hosts':<10}")
-    print("-" * 100)
+    row_format = "{:<20} {:<15} {:<15} {:<15} {:<30} {:<10}".format
+    header = [
+        "\n" + "=" * 100,
+        f"{'Subnet Information':^100}",
+        "=" * 100,
+        row_format('Subnet', 'Network Address', 'Broadcast', 'Mask', 'Range', 'Hosts'),
+        "-" * 100
+    ]
+    
+    def format_row(subnet: Tuple[int, int]) -> str:
+        network, prefix = subnet
+        prefix_info = _PREFIX_INFO[prefix]
+        broadcast = network | (0xFFFFFFFF >> prefix)
+        network_str = _format_ip(network)
+        if prefix < 31:
+            first_host, last_host = network + 1, broadcast - 1
+        else:
+            first_host, last_host = network, broadcast
+        return row_format(f"{network_str}/{prefix}",
+                          network_str,
+                          _format_ip(broadcast),
+                          prefix_info['subnet_mask'],
+                          f"{_format_ip(first_host)} - {_format_ip(last_host)}",
+                          prefix_info['num_hosts']) + "\n"
+    
+    # Stream rows through the buffered stdout as the subnets are produced
+    sys.stdout.write("\n".join(header) + "\n")
+    sys.stdout.writelines(map(format_row, chain((first,), subnets)))
+    sys.stdout.write("=" * 100 + "\n\n")
+
+
+def _network_argument(value: str) -> ipaddress.IPv4Network:
+    """
+    Parse a network command-line argument once, at the argparse boundary.
     
-    for i, subnet in enumerate(subnets, 1):
-        host_range = f"{next(subnet.hosts()) if subnet.num_addresses > 1 else subnet.network_address} - " + \
-                    f"{list(subnet.hosts())[-1] if subnet.num_addresses > 1 else subnet.broadcast_address}"
-        
-        print(f"{str(subnet):<20} "
-              f"{str(subnet.network_address):<15} "
-              f"{str(subnet.broadcast_address):<15} "
-              f"{str(subnet.netmask):<15} "
-              f"{host_range:<30} "
-              f"{subnet.num_addresses - 2 if subnet.prefixlen < 31 else subnet.num_addresses:<10}")
+    Args:
+        value: The raw argument string
+        
+    Returns:
+        An IPv4Network object
+        
+    Raises:
+        argparse.ArgumentTypeError: If the argument is not a valid IP network
+    """
+    import argparse
     
-    print("=" * 100 + "\n")
+    try:
+        return SubnetCalculator.validate_ip_network(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
 
 
-def parse_arguments() -> argparse.Namespace:
+def parse_arguments() -> "argparse.Namespace":
     """
     Parse command-line arguments.
     
     Returns:
         An argparse.Namespace object containing the arguments
     """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="IP Subnetting Practice Tool - Calculate subnet information, divide networks, and more.",
         formatter_class=argparse.RawTextHelpFormatter
@@ -323,11 +531,11 @@ def parse_arguments() -> argparse.Namespace:
     
     # Network Info Mode
     info_parser = subparsers.add_parser('info', help='Calculate network information')
-    info_parser.add_argument('network', help='Network in CIDR notation (e.g. 192.168.1.0/24) or with mask (e.g. 192.168.1.0 255.255.255.0)')
+    info_parser.add_argument('network', type=_network_argument, help='Network in CIDR notation (e.g. 192.168.1.0/24) or with mask (e.g. 192.168.1.0 255.255.255.0)')
     
     # Subnet Network Mode
     subnet_parser = subparsers.add_parser('subnet', help='Divide a network into smaller subnets')
-    subnet_parser.add_argument('network', help='Network in CIDR notation (e.g. 192.168.1.0/24) or with mask (e.g. 192.168.1.0 255.255.255.0)')
+    subnet_parser.add_argument('network', type=_network_argument, help='Network in CIDR notation (e.g. 192.168.1.0/24) or with mask (e.g. 192.168.1.0 255.255.255.0)')
     subnet_group = subnet_parser.add_mutually_exclusive_group(required=True)
     subnet_group.add_argument('-n', '--num-subnets', type=int, help='Number of subnets to create (must be a power of 2)')
     subnet_group.add_argument('-p', '--prefix-length', type=int, help='New prefix length for the subnets')
@@ -339,7 +547,7 @@ def parse_arguments() -> argparse.Namespace:
     
     # Find Supernet Mode
     supernet_parser = subparsers.add_parser('supernet', help='Find the smallest supernet that contains all provided networks')
-    supernet_parser.add_argument('networks', nargs='+', help='Two or more networks in CIDR notation')
+    supernet_parser.add_argument('networks', nargs='+', type=_network_argument, help='Two or more networks in CIDR notation')
     
     # Interactive Mode
     subparsers.add_parser('interactive', help='Enter interactive mode')
@@ -368,8 +576,7 @@ def interactive_mode() -> None:
         if choice == '1':
             network_str = input("Enter network (e.g. 192.168.1.0/24 or 192.168.1.0 255.255.255.0): ").strip()
             try:
-                info = SubnetCalculator.get_network_info(network_str)
-                print_network_info(info)
+                _write_network_info(network_str)
             except ValueError as e:
                 print(f"Error: {e}")
                 
@@ -380,15 +587,15 @@ def interactive_mode() -> None:
             try:
                 if subnet_type == 'n':
                     num_subnets = int(input("Enter number of subnets (must be a power of 2): ").strip())
-                    subnets = SubnetCalculator.subnet_network(network_str, num_subnets=num_subnets)
+                    bases, new_prefix = SubnetCalculator.subnet_network_bases(network_str, num_subnets=num_subnets)
                 elif subnet_type == 'p':
                     prefix_length = int(input("Enter new prefix length: ").strip())
-                    subnets = SubnetCalculator.subnet_network(network_str, new_prefix_length=prefix_length)
+                    bases, new_prefix = SubnetCalculator.subnet_network_bases(network_str, new_prefix_length=prefix_length)
                 else:
                     print("Invalid choice. Please enter 'n' or 'p'.")
                     continue
                 
-                print_subnet_list(subnets)
+                _write_subnet_table(zip(bases, repeat(new_prefix)))
             except ValueError as e:
                 print(f"Error: {e}")
                 
@@ -396,7 +603,7 @@ def interactive_mode() -> None:
             try:
                 num_hosts = int(input("Enter number of hosts required: ").strip())
                 prefix_length = SubnetCalculator.find_subnet_for_hosts(num_hosts)
-                print(f"\nFor {num_hosts} hosts, you need a /{prefix_length} subnet (netmask: {str(ipaddress.IPv4Network(f'0.0.0.0/{prefix_length}').netmask)})")
+                print(f"\nFor {num_hosts} hosts, you need a /{prefix_length} subnet (netmask: {SubnetCalculator.get_prefix_info(prefix_length)['subnet_mask']})")
                 print(f"This subnet can accommodate {2**(32-prefix_length) - 2} hosts\n")
                 
                 apply_mask = input("Apply this mask to a specific network? (y/n): ").strip().lower()
@@ -404,8 +611,7 @@ def interactive_mode() -> None:
                     base_network = input("Enter base network IP (e.g. 192.168.1.0): ").strip()
                     try:
                         network = ipaddress.IPv4Network(f"{base_network}/{prefix_length}", strict=False)
-                        info = SubnetCalculator.get_network_info(str(network))
-                        print_network_info(info)
+                        _write_network_info(network)
                     except ValueError as e:
                         print(f"Error: {e}")
             except ValueError as e:
@@ -419,8 +625,7 @@ def interactive_mode() -> None:
                 supernet = SubnetCalculator.get_supernet(networks)
                 if supernet:
                     print(f"\nSupernet that contains all provided networks: {supernet}\n")
-                    info = SubnetCalculator.get_network_info(str(supernet))
-                    print_network_info(info)
+                    _write_network_info(supernet)
                 else:
                     print("\nNo common supernet found for the provided networks.\n")
             except ValueError as e:
@@ -444,32 +649,29 @@ def main() -> None:
     
     try:
         if args.mode == 'info':
-            info = SubnetCalculator.get_network_info(args.network)
-            print_network_info(info)
+            _write_network_info(args.network)
             
         elif args.mode == 'subnet':
             if args.num_subnets:
-                subnets = SubnetCalculator.subnet_network(args.network, num_subnets=args.num_subnets)
+                bases, new_prefix = SubnetCalculator.subnet_network_bases(args.network, num_subnets=args.num_subnets)
             else:
-                subnets = SubnetCalculator.subnet_network(args.network, new_prefix_length=args.prefix_length)
-            print_subnet_list(subnets)
+                bases, new_prefix = SubnetCalculator.subnet_network_bases(args.network, new_prefix_length=args.prefix_length)
+            _write_subnet_table(zip(bases, repeat(new_prefix)))
             
         elif args.mode == 'hosts':
             prefix_length = SubnetCalculator.find_subnet_for_hosts(args.num_hosts)
-            print(f"\nFor {args.num_hosts} hosts, you need a /{prefix_length} subnet (netmask: {str(ipaddress.IPv4Network(f'0.0.0.0/{prefix_length}').netmask)})")
+            print(f"\nFor {args.num_hosts} hosts, you need a /{prefix_length} subnet (netmask: {SubnetCalculator.get_prefix_info(prefix_length)['subnet_mask']})")
             print(f"This subnet can accommodate {2**(32-prefix_length) - 2} hosts\n")
             
             if args.base_network:
                 network = ipaddress.IPv4Network(f"{args.base_network}/{prefix_length}", strict=False)
-                info = SubnetCalculator.get_network_info(str(network))
-                print_network_info(info)
+                _write_network_info(network)
                 
         elif args.mode == 'supernet':
             supernet = SubnetCalculator.get_supernet(args.networks)
             if supernet:
                 print(f"\nSupernet that contains all provided networks: {supernet}\n")
-                info = SubnetCalculator.get_network_info(str(supernet))
-                print_network_info(info)
+                _write_network_info(supernet)
             else:
                 print("\nNo common supernet found for the provided networks.\n")
                 
@@ -31,9 +31,16 @@ class TestSubnetCalculator(unittest.TestCase):
         network = SubnetCalculator.validate_ip_network("192.168.1.0 255.255.255.0")
         self.assertEqual(str(network), "192.168.1.0/24")
         
+        # Test an already parsed network is passed through
+        self.assertIs(SubnetCalculator.validate_ip_network(network), network)
+        
         # Test with invalid format
         with self.assertRaises(ValueError):
             SubnetCalculator.validate_ip_network("invalid_network")
+        
+        # Test a netmask with a leading-zero octet is rejected rather than read as octal
+        with self.assertRaises(ValueError):
+            SubnetCalculator.validate_ip_network("10.0.0.1 255.255.255.010")
 
     def test_get_network_info(self):
         """Test the get_network_info method."""
@@ -48,6 +55,10 @@ class TestSubnetCalculator(unittest.TestCase):
         self.assertEqual(info["Number of Hosts"], "254")
         self.assertEqual(info["IP Range"], "192.168.1.1 - 192.168.1.254")
         self.assertEqual(info["CIDR Notation"], "192.168.1.0/24")
+        
+        # Point-to-point links use both addresses
+        info = SubnetCalculator.get_network_info("10.0.0.0/31")
+        self.assertEqual(info["IP Range"], "10.0.0.0 - 10.0.0.1")
 
     def test_subnet_network_by_count(self):
         """Test the subnet_network method with subnet count."""
@@ -79,6 +90,32 @@ class TestSubnetCalculator(unittest.TestCase):
         with self.assertRaises(ValueError):
             SubnetCalculator.subnet_network("192.168.1.0/24", new_prefix_length=23)
 
+    def test_subnet_network_bases(self):
+        """Test the subnet_network_bases method."""
+        # Divide a /16 into /24 subnets
+        bases, new_prefix = SubnetCalculator.subnet_network_bases("10.1.0.0/16", new_prefix_length=24)
+        
+        self.assertEqual(new_prefix, 24)
+        self.assertEqual(len(bases), 256)
+        self.assertEqual(str(ipaddress.IPv4Address(bases[1])), "10.1.1.0")
+        self.assertEqual(str(ipaddress.IPv4Address(bases[-1])), "10.1.255.0")
+        
+        # Test with a subnet count that is not a power of 2
+        with self.assertRaises(ValueError):
+            SubnetCalculator.subnet_network_bases("10.1.0.0/16", num_subnets=3)
+
+    def test_iter_subnets(self):
+        """Test the iter_subnets method."""
+        # Divide a /8 into /24 subnets without building them all
+        subnets = SubnetCalculator.iter_subnets("10.0.0.0/8", new_prefix_length=24)
+        
+        self.assertEqual(str(next(subnets)), "10.0.0.0/24")
+        self.assertEqual(str(next(subnets)), "10.0.1.0/24")
+        
+        # Invalid arguments are rejected before iteration starts
+        with self.assertRaises(ValueError):
+            SubnetCalculator.iter_subnets("10.0.0.0/8", num_subnets=3)
+
     def test_find_subnet_for_hosts(self):
         """Test the find_subnet_for_hosts method."""
         # For 100 hosts
@@ -97,6 +134,40 @@ class TestSubnetCalculator(unittest.TestCase):
         with self.assertRaises(ValueError):
             SubnetCalculator.find_subnet_for_hosts(0)
 
+    def test_find_subnet_for_hosts_exceeds_ipv4(self):
+        """Test find_subnet_for_hosts with more hosts than IPv4 can hold."""
+        with self.assertRaises(ValueError):
+            SubnetCalculator.find_subnet_for_hosts(2 ** 32)
+
+    def test_find_subnets_for_hosts(self):
+        """Test the find_subnets_for_hosts method."""
+        # Results match find_subnet_for_hosts, in input order
+        host_counts = [25, 60, 10, 254, 255]
+        prefixes = SubnetCalculator.find_subnets_for_hosts(host_counts)
+        self.assertEqual(prefixes, [SubnetCalculator.find_subnet_for_hosts(n) for n in host_counts])
+        self.assertEqual(SubnetCalculator.find_subnets_for_hosts([]), [])
+        
+        # Test with an invalid number of hosts anywhere in the batch
+        with self.assertRaises(ValueError):
+            SubnetCalculator.find_subnets_for_hosts([10, 0])
+        with self.assertRaises(ValueError):
+            SubnetCalculator.find_subnets_for_hosts([10, 2**32])
+
+    def test_get_prefix_info(self):
+        """Test the get_prefix_info method."""
+        info = SubnetCalculator.get_prefix_info(24)
+        self.assertEqual(info["subnet_mask"], "255.255.255.0")
+        self.assertEqual(info["wildcard_mask"], "0.0.0.255")
+        self.assertEqual(info["num_hosts"], 254)
+        self.assertEqual(info["num_networks"], 16777216)
+        
+        # Point-to-point links use both addresses
+        self.assertEqual(SubnetCalculator.get_prefix_info(31)["num_hosts"], 2)
+        
+        # Test with invalid prefix length
+        with self.assertRaises(ValueError):
+            SubnetCalculator.get_prefix_info(33)
+
     def test_get_ip_class(self):
         """Test the _get_ip_class method."""
         # Class A
@@ -123,7 +194,7 @@ class TestSubnetCalculator(unittest.TestCase):
         """Test the get_supernet method."""
         # Test with 2 networks
         supernet = SubnetCalculator.get_supernet(["192.168.1.0/24", "192.168.2.0/24"])
-        self.assertEqual(str(supernet), "192.168.0.0/23")
+        self.assertEqual(str(supernet), "192.168.0.0/22")
         
         # Test with 4 networks
         supernet = SubnetCalculator.get_supernet([
@@ -134,6 +205,21 @@ class TestSubnetCalculator(unittest.TestCase):
         ])
         self.assertEqual(str(supernet), "172.16.16.0/22")
         
+        # Test with non-contiguous networks
+        supernet = SubnetCalculator.get_supernet(["10.0.0.0/24", "10.0.3.0/24"])
+        self.assertEqual(str(supernet), "10.0.0.0/22")
+        
+        # Test with already parsed network objects
+        supernet = SubnetCalculator.get_supernet([
+            ipaddress.IPv4Network("10.1.0.0/16"),
+            ipaddress.IPv4Network("10.2.0.0/16")
+        ])
+        self.assertEqual(str(supernet), "10.0.0.0/14")
+        
+        # Test with a generator of networks
+        supernet = SubnetCalculator.get_supernet(f"172.16.{i}.0/24" for i in range(4))
+        self.assertEqual(str(supernet), "172.16.0.0/22")
+        
         # Test with invalid input
         with self.assertRaises(ValueError):
             SubnetCalculator.get_supernet([])